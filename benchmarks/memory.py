@@ -0,0 +1,122 @@
+"""Measure memory used by dependency graphs and resolved scopes.
+
+Build many `Injector` subclasses with the same definitions the way applications
+holding one container per tenant configuration do. Report bytes allocated per
+dependency specification, per resolution plan, per subclass redefining a single
+attribute, and per scope kept alive by the `with` statement.
+
+Run it with `python benchmarks/memory.py` having `src` directory on `PYTHONPATH`.
+
+"""
+import gc
+import tracemalloc
+
+from dependencies import Injector
+from dependencies import shield
+from dependencies import value
+
+
+INJECTORS = 500
+SCOPES = 2000
+
+
+class _Settings:
+    def __init__(self, name, debug, timeout=10):
+        self.name = name
+
+
+class _Client:
+    def __init__(self, settings, token):
+        self.settings = settings
+
+
+class _Service:
+    def __init__(self, client, settings, handlers):
+        self.client = client
+
+
+def _handlers(*names):
+    return list(names)
+
+
+def _token(name):
+    return name.upper()
+
+
+def _definitions(index):
+    return {
+        "service": _Service,
+        "client": _Client,
+        "settings": _Settings,
+        "handlers": shield(_handlers, "audit", "metrics"),
+        "token": value(_token),
+        "name": f"tenant-{index}",
+        "debug": False,
+    }
+
+
+def _injectors():
+    return [
+        type(Injector)("Container", (Injector,), _definitions(index))
+        for index in range(INJECTORS)
+    ]
+
+
+def _subclasses(injector):
+    subclasses = []
+    for index in range(INJECTORS):
+        injector = type(Injector)("Tenant", (injector,), {"name": f"tenant-{index}"})
+        subclasses.append(injector)
+    _materialize(subclasses)
+    return subclasses
+
+
+def _materialize(injectors):
+    # Attributes are analyzed on first access, plans should not pay for specs.
+    for injector in injectors:
+        injector.__dependencies__.check()
+
+
+def _resolve(injectors):
+    for injector in injectors:
+        injector.service
+
+
+def _enter(injector):
+    scopes = [injector.__enter__() for _ in range(SCOPES)]
+    for scope in scopes:
+        scope.service
+    return scopes
+
+
+def _exit(injector):
+    for _ in range(SCOPES):
+        injector.__exit__(None, None, None)
+
+
+def _measure(function, *args):
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    result = function(*args)
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0] - before, result
+
+
+def _main():
+    tracemalloc.start()
+    injectors = _injectors()
+    specs = INJECTORS * len(_definitions(0))
+    graphs, _ = _measure(_materialize, injectors)
+    plans, _ = _measure(_resolve, injectors)
+    subclasses, _ = _measure(_subclasses, injectors[0])
+    scopes, _ = _measure(_enter, injectors[0])
+    _exit(injectors[0])
+    print(f"{INJECTORS} injectors with {specs // INJECTORS} dependencies each:\n")
+    print(f"{'spec':>8}: {graphs / specs:8.0f} bytes")
+    print(f"{'plan':>8}: {plans / INJECTORS:8.0f} bytes")
+    print(f"{'subclass':>8}: {subclasses / INJECTORS:8.0f} bytes")
+    print(f"{'scope':>8}: {scopes / SCOPES:8.0f} bytes")
+
+
+if __name__ == "__main__":  # pragma: no branch
+    _main()
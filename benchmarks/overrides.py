@@ -0,0 +1,93 @@
+"""Check that per request overrides do not grow process memory.
+
+Override the `Injector` subclass with a new request object a million times the way
+web workers do. Resolve an attribute and enter the `with` statement on each
+override. Lazy proxy is used on every other request only, the rest leave it
+untouched. Garbage collector is disabled, so everything has to be freed by
+reference counting alone. Fail if resident set size grows after the warm up.
+
+Run it with `python benchmarks/overrides.py` having `src` directory on `PYTHONPATH`.
+
+"""
+import gc
+import resource
+
+from dependencies import Injector
+from dependencies import lazy
+from dependencies import value
+
+
+OVERRIDES = 1_000_000
+WARMUP = 100_000
+TOLERANCE = 1024  # Kilobytes.
+
+
+class _Request:
+    def __init__(self, index):
+        self.payload = bytearray(256)
+
+
+class _Repository:
+    def __init__(self, request, settings):
+        self.request = request
+
+
+class _Renderer:
+    def __init__(self, request):
+        self.request = request
+
+
+class _View:
+    def __init__(self, repository, renderer, user):
+        self.repository = repository
+        self.renderer = renderer
+
+
+def _user(request):
+    return id(request)
+
+
+def _transaction(repository):
+    yield
+
+
+class _Container(Injector):
+    view = _View
+    repository = _Repository
+    renderer = lazy(_Renderer)
+    user = value(_user)
+    transaction = value(_transaction)
+    settings = {"debug": False}
+
+
+def _serve(start, stop):
+    for index in range(start, stop):
+        override = _Container(request=_Request(index))
+        if index % 2:
+            override.view.renderer.request
+            with override as scope:
+                scope.view.renderer.request
+        else:
+            override.view
+            with override as scope:
+                scope.view
+
+
+def _rss():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _main():
+    gc.disable()
+    _serve(0, WARMUP)
+    before = _rss()
+    _serve(WARMUP, OVERRIDES)
+    after = _rss()
+    print(f"{OVERRIDES} overrides served:\n")
+    print(f"{'warm up':>8}: {before:8d} KB")
+    print(f"{'total':>8}: {after:8d} KB")
+    assert after - before < TOLERANCE, "Overrides were not freed"  # nosec
+
+
+if __name__ == "__main__":  # pragma: no branch
+    _main()
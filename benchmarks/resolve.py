@@ -0,0 +1,75 @@
+"""Measure the cost of dependency graph resolution.
+
+Compare constructor calls written by hand with the regular `Injector` resolution and
+with the compiled one. Graph is a balanced binary tree of classes where every class
+depends on its two children.
+
+Run it with `python benchmarks/resolve.py` having `src` directory on `PYTHONPATH`.
+
+"""
+from inspect import Parameter
+from inspect import Signature
+from timeit import repeat
+
+from dependencies import compiled
+from dependencies import Injector
+
+
+SIZE = 40
+NUMBER = 2000
+REPEAT = 5
+
+
+def _node(name, args):
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+    parameters = [Parameter("self", Parameter.POSITIONAL_OR_KEYWORD)]
+    parameters.extend(Parameter(arg, Parameter.KEYWORD_ONLY) for arg in args)
+    __init__.__signature__ = Signature(parameters)
+    return type(name, (), {"__init__": __init__})
+
+
+def _children(index):
+    return [f"n{child}" for child in (2 * index + 1, 2 * index + 2) if child < SIZE]
+
+
+def _nodes():
+    return {f"n{index}": _node(f"N{index}", _children(index)) for index in range(SIZE)}
+
+
+def _expression(index):
+    arguments = ", ".join(
+        f"{child}={_expression(int(child[1:]))}" for child in _children(index)
+    )
+    return f"n{index}({arguments})"
+
+
+def _by_hand(nodes):
+    namespace = dict(nodes)
+    code = compile(f"def by_hand():\n    return {_expression(0)}", "<by hand>", "exec")
+    exec(code, namespace)  # nosec
+    return namespace["by_hand"]
+
+
+def _measure(function):
+    return min(repeat(function, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+
+
+def _main():
+    nodes = _nodes()
+    interpreted = type(Injector)("Interpreted", (Injector,), dict(nodes))
+    fast = compiled(type(Injector)("Compiled", (Injector,), dict(nodes)))
+    results = {
+        "by hand": _measure(_by_hand(nodes)),
+        "interpreted": _measure(lambda: interpreted.n0),
+        "compiled": _measure(lambda: fast.n0),
+    }
+    baseline = results["by hand"]
+    print(f"{SIZE} classes resolved {NUMBER} times, best of {REPEAT}:\n")
+    for name, result in results.items():
+        print(f"{name:>12}: {result:8.2f} us  x{result / baseline:.2f}")
+
+
+if __name__ == "__main__":  # pragma: no branch
+    _main()
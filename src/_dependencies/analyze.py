@@ -1,3 +1,6 @@
+from inspect import isclass
+from weakref import WeakKeyDictionary
+
 from _dependencies.objects.attributes import _build_attributes_spec
 from _dependencies.objects.attributes import _is_attributes
 from _dependencies.objects.classes import _build_class_spec
@@ -6,12 +9,16 @@ from _dependencies.objects.data import _build_data_spec
 from _dependencies.objects.data import _is_data
 from _dependencies.objects.descriptor import _is_descriptor
 from _dependencies.objects.enum import _is_enum
+from _dependencies.objects.lazy import _build_lazy_spec
+from _dependencies.objects.lazy import _is_lazy
 from _dependencies.objects.nested import _build_nested_injector_spec
 from _dependencies.objects.nested import _is_nested_injector
 from _dependencies.objects.package import _build_package_spec
 from _dependencies.objects.package import _is_package
 from _dependencies.objects.shield import _build_shield_spec
 from _dependencies.objects.shield import _is_shield
+from _dependencies.objects.singleton import _build_singleton_spec
+from _dependencies.objects.singleton import _is_singleton
 from _dependencies.objects.this import _build_this_spec
 from _dependencies.objects.this import _is_this
 from _dependencies.objects.value import _build_value_spec
@@ -37,17 +44,48 @@ def _iterate(name, state):
 
 
 def _make_dependency_spec(name, dependency):
-    for condition, builder in (  # pragma: no branch
-        (_is_descriptor, None),
-        (_is_enum, None),
-        (_is_attributes, _recursive(_build_attributes_spec)),
-        (_is_nested_injector, _build_nested_injector_spec),
-        (_is_class, _build_class_spec),
-        (_is_this, _build_this_spec),
-        (_is_package, _recursive(_build_package_spec)),
-        (_is_value, _build_value_spec),
-        (_is_shield, _recursive(_build_shield_spec)),
-        (_is_data, _build_data_spec),
-    ):
+    builder = _builders.get(type(dependency))
+    if builder is None:
+        builder = _match(name, dependency)
+    return builder(name, dependency)
+
+
+def _match(name, dependency):
+    for condition, builder in _conditions:  # pragma: no branch
         if condition(name, dependency):
-            return builder(name, dependency)
+            if not isclass(dependency):
+                _register(type(dependency), builder)
+            return builder
+
+
+def _register(kind, builder):
+    _builders[kind] = builder
+
+
+def _build_type_spec(name, dependency):
+    if _is_class(name, dependency):
+        return _build_class_spec(name, dependency)
+    else:
+        return _build_data_spec(name, dependency)
+
+
+_builders = WeakKeyDictionary()
+
+
+_conditions = (
+    (_is_descriptor, None),
+    (_is_enum, None),
+    (_is_attributes, _recursive(_build_attributes_spec)),
+    (_is_nested_injector, _build_nested_injector_spec),
+    (_is_class, _build_class_spec),
+    (_is_this, _build_this_spec),
+    (_is_package, _recursive(_build_package_spec)),
+    (_is_value, _build_value_spec),
+    (_is_shield, _recursive(_build_shield_spec)),
+    (_is_singleton, _recursive(_build_singleton_spec)),
+    (_is_lazy, _recursive(_build_lazy_spec)),
+    (_is_data, _build_data_spec),
+)
+
+
+_register(type, _build_type_spec)
@@ -0,0 +1,100 @@
+from itertools import takewhile
+
+from _dependencies.exceptions import DependencyError
+from _dependencies.objects.attributes import _AttributesFactory
+from _dependencies.objects.nested import _NestedInjectorFactory
+from _dependencies.objects.shield import _ShieldFactory
+from _dependencies.objects.this import _is_attribute
+from _dependencies.objects.this import _ThisFactory
+from _dependencies.trace import _format
+
+
+def _check_circles(name, graph, attrnames):
+    chain = ((name, graph),)
+    done = set()
+    for attrname in attrnames:
+        if _key(chain, attrname) not in done:
+            _visit(chain, attrname, done)
+
+
+def _visit(chain, attrname, done):
+    path = [(chain, attrname)]
+    visiting = {_key(chain, attrname)}
+    edges = [iter(_edges(chain, attrname))]
+    while edges:
+        for node in edges[-1]:
+            key = _key(*node)
+            if key in visiting:
+                path.append(node)
+                raise DependencyError(_format(circle_error, _lines(path)))
+            elif key not in done:
+                path.append(node)
+                visiting.add(key)
+                edges.append(iter(_edges(*node)))
+                break
+        else:
+            key = _key(*path.pop())
+            visiting.remove(key)
+            done.add(key)
+            edges.pop()
+
+
+def _edges(chain, attrname):
+    graph = chain[-1][1]
+    spec = graph.get(attrname)
+    if spec is None:
+        return []
+    edges = [(chain, arg) for arg in spec.args if graph.has(arg)]
+    edges.extend(_references(chain, spec.factory))
+    return edges
+
+
+def _references(chain, factory):
+    if isinstance(factory, _ThisFactory):
+        yield from _follow(chain, factory.expression)
+    elif isinstance(factory, _ShieldFactory):
+        for argument in factory.args_factories:
+            yield from _references(chain, argument)
+    elif isinstance(factory, _AttributesFactory) and isinstance(
+        factory.factory, _NestedInjectorFactory
+    ):
+        nested = _enter(chain, factory.factory.injector)
+        if nested is not None:
+            yield from _follow(nested, tuple((".", attr) for attr in factory.attrs))
+
+
+def _follow(chain, expression):
+    for operator, symbol in takewhile(_is_attribute, expression):
+        if symbol == "__parent__":
+            if len(chain) == 1:
+                return
+            chain = chain[:-1]
+            continue
+        yield chain, symbol
+        spec = chain[-1][1].get(symbol)
+        if spec is None or not isinstance(spec.factory, _NestedInjectorFactory):
+            return
+        chain = _enter(chain, spec.factory.injector)
+        if chain is None:
+            return
+
+
+def _enter(chain, injector):
+    graph = injector.__dependencies__
+    if any(graph is link[1] for link in chain):
+        return None
+    return (*chain, (injector.__name__, graph))
+
+
+def _key(chain, attrname):
+    return tuple(link[1] for link in chain), attrname
+
+
+def _lines(path):
+    return [f"{chain[-1][0]}.{attrname}" for chain, attrname in path]
+
+
+# Messages.
+
+
+circle_error = "Circle error found in definition of the dependency graph"
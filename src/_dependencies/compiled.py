@@ -0,0 +1,86 @@
+from _dependencies.exceptions import DependencyError
+from _dependencies.objects.classes import _ClassFactory
+from _dependencies.objects.nested import _InjectorTypeType
+from _dependencies.objects.value import _ValueFactory
+
+
+def compiled(injector):
+    """Resolve dependencies of the `Injector` subclass with generated functions.
+
+    Each resolution plan would be turned into a function which calls constructors
+    one after another without inspection of the dependency graph.
+
+    Used as class decorator.
+
+    """
+    _check_injector(injector)
+    injector.__dependencies__.compiled = True
+    return injector
+
+
+def _compile(graph, plan):
+    namespace = {}
+    results = {"__self__": "__self__"}
+    lines = ["def build(graph, cache, remember):", "    __self__ = cache['__self__']"]
+    for index, (name, seed) in enumerate(plan.seeds.items()):
+        namespace[f"s{index}"] = seed
+        results[name] = f"s{index}"
+    for index, name in enumerate(_values(graph, plan)):
+        lines.append(f"    v{index} = cache[{name!r}]")
+        results[name] = f"v{index}"
+    reentrant = False
+    for index, step in enumerate(plan.steps):
+        result = f"_{index}"
+        statements = _statements(graph, step, index, namespace, results)
+        statements.append(f"cache[{step.name!r}] = {result}")
+        if reentrant:
+            lines.append(f"    if {step.name!r} in cache:")
+            lines.append(f"        {result} = cache[{step.name!r}]")
+            lines.append("    else:")
+            lines.extend("        " + statement for statement in statements)
+        else:
+            lines.extend("    " + statement for statement in statements)
+        results[step.name] = result
+        reentrant = reentrant or "__self__" in step.args
+    lines.append(f"    return {result}")
+    code = compile("\n".join(lines), "<dependencies>", "exec")
+    exec(code, namespace)  # nosec
+    return namespace["build"]
+
+
+def _values(graph, plan):
+    return dict.fromkeys(
+        arg for step in plan.steps for arg in step.args if arg in graph.values
+    )
+
+
+def _statements(graph, step, index, namespace, results):
+    spec = graph.get(step.name)
+    factory = spec.factory
+    arguments = ", ".join(f"{arg}={results[arg]}" for arg in step.args)
+    function = f"f{index}"
+    if spec.is_singleton:
+        # Plans could be shared between overrides with their own singletons.
+        return [f"_{index}, destructor = graph.factory({step.name!r})({arguments})"]
+    elif isinstance(factory, _ValueFactory):
+        namespace[function] = factory.function
+        return [f"_{index} = {function}({arguments})"]
+    elif isinstance(factory, _ClassFactory) and _no_scopes(graph, step.args):
+        namespace[function] = factory.cls
+        return [f"_{index} = {function}({arguments})"]
+    else:
+        namespace[function] = factory
+        return [
+            f"_{index}, destructor = {function}({arguments})",
+            "remember(destructor)",
+        ]
+
+
+def _no_scopes(graph, args):
+    return not any("__self__" in graph.get(arg).args for arg in args)
+
+
+def _check_injector(injector):
+    if not isinstance(injector, _InjectorTypeType):
+        message = "'compiled' decorator can be used on Injector subclasses only"
+        raise DependencyError(message)
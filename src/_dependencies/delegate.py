@@ -1,24 +1,32 @@
+from functools import lru_cache
+
 from _dependencies.exceptions import DependencyError
 
 
-def _setattr_method(cls, attrname, value):
-    raise DependencyError("'Injector' modification is not allowed")
+class _Delegate:
+    def __new__(cls, name, graph, scope):
+        instance = _delegate_class(name)()
+        object.__setattr__(instance, "__graph__", graph)
+        object.__setattr__(instance, "__scope__", scope)
+        return instance
 
 
-def _delattr_method(cls, attrname):
-    raise DependencyError("'Injector' modification is not allowed")
+class _DelegateMethods:
+    __slots__ = ("__graph__", "__scope__")
 
+    def __getattr__(self, attrname):
+        resolved = getattr(self.__scope__, attrname)
+        self.__graph__.get(attrname).resolved()
+        self.__graph__.touch(attrname)
+        return resolved
 
-class _Delegate:
-    def __new__(cls, name, graph, scope):
-        def _getattr_method(self, attrname):
-            resolved = getattr(scope, attrname)
-            graph.get(attrname).resolved()
-            return resolved
-
-        methods = {
-            "__getattr__": _getattr_method,
-            "__setattr__": _setattr_method,
-            "__delattr__": _delattr_method,
-        }
-        return type(name, (), methods)()
+    def __setattr__(self, attrname, value):
+        raise DependencyError("'Injector' modification is not allowed")
+
+    def __delattr__(self, attrname):
+        raise DependencyError("'Injector' modification is not allowed")
+
+
+@lru_cache(maxsize=None)
+def _delegate_class(name):
+    return type(name, (_DelegateMethods,), {"__slots__": ()})
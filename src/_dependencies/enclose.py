@@ -1,7 +1,12 @@
+from inspect import isawaitable
+
+from _dependencies.objects.lazy import _release
 from _dependencies.resolve import _Resolver
 
 
 class _Enclose:
+    __slots__ = ("callbacks", "scope")
+
     def __init__(self):
         self.callbacks = []
 
@@ -16,3 +21,15 @@ class _Enclose:
     def after(self):
         for callback in self.callbacks:
             callback()
+        _release(self.scope)
+
+    async def abefore(self, graph, cache, tasks):
+        for context in graph.contexts:
+            await _Resolver(graph, cache, context, self.add).aresolve(tasks)
+
+    async def aafter(self):
+        for callback in self.callbacks:
+            result = callback()
+            if isawaitable(result):
+                await result
+        _release(self.scope)
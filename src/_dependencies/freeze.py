@@ -0,0 +1,42 @@
+from _dependencies.circles import _check_circles
+from _dependencies.exceptions import DependencyError
+from _dependencies.objects.nested import _InjectorTypeType
+from _dependencies.objects.nested import _IsOverride
+from _dependencies.objects.nested import _NestedInjectorFactory
+from _dependencies.scope import _Scope
+
+
+def freeze(injector):
+    """Analyze the `Injector` subclass and plan resolution of all its attributes.
+
+    Missing dependencies and circle definitions would be reported immediately.
+    Attribute access would not pay for the first touch analysis later.
+
+    Could be used as class decorator.
+
+    """
+    _check_injector(injector)
+    _freeze(injector, set())
+    return injector
+
+
+def _freeze(injector, done):
+    graph = injector.__dependencies__
+    if graph in done:
+        return
+    done.add(graph)
+    graph.check()
+    names = list(graph.names())
+    _check_circles(injector.__name__, graph, names)
+    scope = _Scope(injector.__name__, graph, lambda graph, cache: None)
+    for name in names:
+        graph.plan(scope, name)
+        factory = graph.get(name).factory
+        if isinstance(factory, _NestedInjectorFactory):
+            _freeze(factory.injector, done)
+
+
+def _check_injector(injector):
+    if not isinstance(injector, (_InjectorTypeType, _IsOverride)):
+        message = "'freeze' function can be used on Injector subclasses only"
+        raise DependencyError(message)
@@ -1,31 +1,249 @@
+from threading import RLock
+
 from _dependencies.analyze import _make_dependency_spec
+from _dependencies.circles import _check_circles
+from _dependencies.compiled import _compile
 from _dependencies.exceptions import DependencyError
+from _dependencies.objects.data import _DataFactory
+from _dependencies.objects.singleton import _SingletonFactory
+from _dependencies.objects.value import _is_value
+from _dependencies.plan import _Planner
+from _dependencies.storage import _storage
 
 
 class _Graph:
-    def __init__(self):
+    __slots__ = (
+        "parents",
+        "specs",
+        "pending",
+        "index",
+        "contexts",
+        "values",
+        "plans",
+        "shapes",
+        "compiled",
+        "singletons",
+        "accessed",
+        "lock",
+    )
+
+    def __init__(self, parents=()):
+        self.parents = parents
         self.specs = {}
+        self.pending = {}
+        self.index = {}
         self.contexts = []
+        self.values = {}
+        self.plans = {}
+        self.shapes = {}
+        self.compiled = any(parent.compiled for parent in parents)
+        self.singletons = {}
+        self.accessed = set()
+        self.lock = RLock()
+        for parent in reversed(parents):
+            for name in parent.contexts:
+                _track_context(self.contexts, name, self.get(name).is_context)
 
     def get(self, name):
-        return self.specs.get(name)
+        spec = self.index.get(name)
+        if spec is None:
+            spec = _lookup(self, name)
+            if spec is not None:
+                self.index[name] = spec
+        return spec
 
     def assign(self, name, dependency):
         _check_dunder_name(name)
-        self.specs[name] = _make_dependency_spec(name, dependency)
-        if self.specs[name].is_context:
-            self.contexts.append(name)
+        self.index.pop(name, None)
+        if _is_value(name, dependency):
+            # Setup and teardown should be known before the first attribute access.
+            self.specs[name] = _make_dependency_spec(name, dependency)
+            _track_context(self.contexts, name, self.specs[name].is_context)
+        else:
+            self.pending[name] = dependency
+            _track_context(self.contexts, name, False)
+
+    def check(self):
+        for name in self.names():
+            self.get(name)
+        _storage.flush()
+
+    def factory(self, name):
+        return _factory(self, name)
+
+    def has(self, name):
+        return self.get(name) is not None
+
+    def names(self):
+        names = dict.fromkeys(self.specs)
+        names.update(dict.fromkeys(self.pending))
+        for parent in self.parents:
+            names.update(dict.fromkeys(parent.names()))
+        return names.keys()
+
+    def known(self):
+        return self.singletons
+
+    def touch(self, name):
+        self.accessed.add(name)
+
+    def forget(self, name):
+        _discard(self.plans, name)
+        for plans in self.shapes.values():
+            _discard(plans, name)
+
+    def shape(self, names):
+        return self.shapes.setdefault(names, {})
+
+    def plan(self, scope, attrname):
+        return _plan(self, scope, attrname)
+
+
+class _Overlay:
+    __slots__ = (
+        "parent",
+        "specs",
+        "contexts",
+        "values",
+        "plans",
+        "singletons",
+        "taint",
+        "lock",
+    )
+
+    def __init__(self, parent, overrides):
+        self.parent = parent
+        self.specs = {}
+        self.contexts = [name for name in parent.contexts if name not in overrides]
+        self.values = {}
+        for name, dependency in overrides.items():
+            _check_dunder_name(name)
+            self.specs[name] = _make_dependency_spec(name, dependency)
+            _track_context(self.contexts, name, self.specs[name].is_context)
+            if isinstance(self.specs[name].factory, _DataFactory):
+                self.values[name] = self.specs[name].factory.value
+        if len(self.values) == len(self.specs):
+            self.plans = parent.shape(frozenset(self.values))
+        else:
+            self.plans = {}
+        self.singletons = {}
+        self.taint = {}
+        self.lock = parent.lock
+
+    @property
+    def compiled(self):
+        return self.parent.compiled
+
+    @property
+    def accessed(self):
+        return self.parent.accessed
+
+    def get(self, name):
+        spec = self.specs.get(name)
+        if spec is None:
+            return self.parent.get(name)
+        return spec
+
+    def factory(self, name):
+        spec = self.get(name)
+        if spec.is_singleton and not self.tainted(name):
+            return _SingletonFactory(self.parent, name, spec.factory)
+        return _factory(self, name)
 
     def has(self, name):
-        return name in self.specs
+        return name in self.specs or self.parent.has(name)
+
+    def tainted(self, name):
+        result = self.taint.get(name)
+        if result is None:
+            spec = self.get(name)
+            result = (
+                name in self.specs
+                or "__self__" in spec.args
+                or any(self.tainted(arg) for arg in spec.args if self.has(arg))
+            )
+            self.taint[name] = result
+        return result
+
+    def check(self):
+        self.parent.check()
+
+    def touch(self, name):
+        self.parent.touch(name)
+
+    def names(self):
+        return self.parent.names() | self.specs.keys()
+
+    def known(self):
+        known = {
+            name: singleton
+            for name, singleton in self.parent.known().items()
+            if not self.tainted(name)
+        }
+        known.update(self.singletons)
+        return known
+
+    def forget(self, name):
+        # Plans shared between overrides should not see our own singletons.
+        self.plans = dict(self.plans)
+        _discard(self.plans, name)
+
+    def plan(self, scope, attrname):
+        return _plan(self, scope, attrname)
+
+
+def _lookup(graph, name):
+    spec = graph.index.get(name) or graph.specs.get(name)
+    if spec is None and name in graph.pending:
+        with graph.lock:
+            spec = _analyze(graph, name)
+    if spec is None:
+        for parent in graph.parents:
+            spec = _lookup(parent, name)
+            if spec is not None:
+                break
+    return spec
+
+
+def _analyze(graph, name):
+    # Another thread could analyze the attribute while we were waiting for the lock.
+    spec = graph.specs.get(name) or _make_dependency_spec(name, graph.pending[name])
+    graph.specs[name] = spec
+    graph.pending.pop(name, None)
+    return spec
+
+
+def _factory(graph, name):
+    spec = graph.get(name)
+    if spec.is_singleton:
+        return _SingletonFactory(graph, name, spec.factory)
+    return spec.factory
+
+
+def _plan(graph, scope, attrname):
+    plan = graph.plans.get(attrname)
+    if plan is None:
+        with graph.lock:
+            _check_circles(type(scope).__name__, graph, (attrname,))
+            plan = _Planner(graph, scope, attrname).plan()
+            graph.plans[attrname] = plan
+            _storage.flush()
+    if graph.compiled and plan.builder is None and plan.steps:
+        plan.builder = _compile(graph, plan)
+    return plan
+
+
+def _discard(plans, name):
+    # Plans built the singleton, they would skip its arguments once planned again.
+    for attrname in [k for k, plan in plans.items() if name in plan.names]:
+        del plans[attrname]
 
-    def update(self, graph):
-        self.specs.update(graph.specs)
 
-    def copy(self):
-        graph = _Graph()
-        graph.update(self)
-        return graph
+def _track_context(contexts, name, is_context):
+    if name in contexts:
+        contexts.remove(name)
+    if is_context:
+        contexts.append(name)
 
 
 def _check_dunder_name(name):
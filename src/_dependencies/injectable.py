@@ -1,18 +1,40 @@
 from inspect import isclass
+from inspect import isfunction
 from inspect import Parameter
 from inspect import signature
+from weakref import WeakKeyDictionary
 
 from _dependencies.exceptions import DependencyError
+from _dependencies.storage import _storage
 
 
 def _function_args(func, funcname, owner):
-    arguments = _args(func, funcname, owner)
-    return _separate(arguments)
+    return _introspect(_functions, func, funcname, owner, 0)
 
 
 def _method_args(func, funcname, owner):
-    arguments = _args(func, funcname, owner)
-    return _separate(arguments[1:])
+    return _introspect(_methods, func, funcname, owner, 1)
+
+
+def _introspect(cache, func, funcname, owner, skip):
+    if not isfunction(func):
+        # Builtin methods could not be weakly referenced.
+        return _separate(_args(func, funcname, owner)[skip:])
+    result = cache.get(func)
+    if result is None:
+        result = _separate(_persisted(func, funcname, owner)[skip:])
+        if len(cache) >= _cache_size:
+            del cache[next(iter(cache))]
+        cache[func] = result
+    return result
+
+
+def _persisted(func, funcname, owner):
+    args = _storage.load(func)
+    if args is None:
+        args = _args(func, funcname, owner)
+        _storage.save(func, args)
+    return args
 
 
 def _args(func, funcname, owner):
@@ -40,7 +62,7 @@ def _separate(arguments):
         args[name] = have_default
         target = optional if have_default else required
         target.add(name)
-    return args, required, optional
+    return args, frozenset(required), frozenset(optional)
 
 
 def _check_argument_default(argument, value, owner):
@@ -56,6 +78,15 @@ def _check_argument_default(argument, value, owner):
         raise DependencyError(message)
 
 
+_cache_size = 1024
+
+
+_functions = WeakKeyDictionary()
+
+
+_methods = WeakKeyDictionary()
+
+
 # Messages.
 
 
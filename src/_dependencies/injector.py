@@ -1,9 +1,23 @@
+from asyncio import ensure_future
+from collections import deque
+from types import resolve_bases
+from weakref import WeakValueDictionary
+
+from _dependencies.circles import _check_circles
 from _dependencies.delegate import _Delegate
+from _dependencies.delegate import _DelegateMethods
 from _dependencies.exceptions import DependencyError
 from _dependencies.graph import _Graph
+from _dependencies.graph import _Overlay
 from _dependencies.lazy import _LazyGraph
 from _dependencies.objects.nested import _InjectorTypeType
+from _dependencies.objects.lazy import _release
+from _dependencies.objects.nested import _IsOverride
+from _dependencies.resolve import _forget
+from _dependencies.resolve import _Resolver
+from _dependencies.resolve import _wait
 from _dependencies.scope import _Scope
+from _dependencies.scope import _tasks
 from _dependencies.stack import _Stack
 
 
@@ -25,23 +39,42 @@ class _InjectorType(_InjectorTypeType):
             return type.__new__(cls, class_name, bases, ns)
 
     def __call__(cls, **kwargs):
-        return type(cls.__name__, (cls,), kwargs)
+        return _override(cls, kwargs)
 
     def __and__(cls, other):
-        return type(cls.__name__, (cls, other), {})
+        if not isinstance(other, (_InjectorType, _Override)):
+            return _compose(cls, other)
+        return _memoize(_compositions, (cls, other), _compose, cls, other)
 
     def __enter__(cls):
         enclose = cls.__context_stack__.add()
-        scope = _Scope(cls.__name__, cls.__dependencies__, enclose.before)
-        return _Delegate(cls.__name__, cls.__dependencies__, scope)
+        scope = _scope(cls)
+        enclose.scope = scope
+        graph = cls.__dependencies__
+        enclose.before(graph, scope.__cache__)
+        return _Delegate(cls.__name__, graph, scope)
 
     def __exit__(cls, exc_type, exc_value, traceback):
         cls.__context_stack__.remove()
 
+    async def __aenter__(cls):
+        enclose = cls.__context_stack__.add()
+        scope = _scope(cls)
+        enclose.scope = scope
+        graph = cls.__dependencies__
+        await enclose.abefore(graph, scope.__cache__, _tasks(scope))
+        return _Delegate(cls.__name__, graph, scope)
+
+    async def __aexit__(cls, exc_type, exc_value, traceback):
+        await cls.__context_stack__.aremove()
+
     def __getattr__(cls, attrname):
-        scope = _Scope(cls.__name__, cls.__dependencies__, lambda graph, cache: None)
+        scope = _scope(cls)
         delegate = _Delegate(cls.__name__, cls.__dependencies__, scope)
-        return getattr(delegate, attrname)
+        try:
+            return getattr(delegate, attrname)
+        finally:
+            _release(scope)
 
     def __setattr__(cls, attrname, value):
         raise DependencyError("'Injector' modification is not allowed")
@@ -53,11 +86,176 @@ class _InjectorType(_InjectorTypeType):
         return cls.__dependencies__.has(attrname)
 
     def __dir__(cls):
-        return sorted(cls.__dependencies__.specs)
+        return sorted(cls.__dependencies__.names())
+
+    def __subclasscheck__(cls, subclass):
+        if isinstance(subclass, _Override):
+            subclass = subclass.__injector__
+        return type.__subclasscheck__(cls, subclass)
+
+
+class _Override(_IsOverride):
+    __slots__ = (
+        "__name__",
+        "__qualname__",
+        "__injector__",
+        "__overrides__",
+        "__dependencies__",
+        "__context_stack__",
+        "__weakref__",
+    )
+
+    def __init__(self, injector, overrides):
+        graph = _Overlay(injector.__dependencies__, overrides)
+        _check_circles(injector.__name__, graph, overrides)
+        object.__setattr__(self, "__name__", injector.__name__)
+        object.__setattr__(self, "__qualname__", injector.__qualname__)
+        object.__setattr__(self, "__injector__", injector)
+        object.__setattr__(self, "__overrides__", overrides)
+        object.__setattr__(self, "__dependencies__", graph)
+        object.__setattr__(self, "__context_stack__", _Stack())
+
+    @property
+    def __module__(self):
+        return self.__injector__.__module__
+
+    # Doctest module compatibility.
+    __wrapped__ = None  # pragma: no mutate
+
+    def __call__(self, **kwargs):
+        _check_extension_scope((self,), kwargs)
+        return _override(self.__injector__, {**self.__overrides__, **kwargs})
+
+    def __and__(self, other):
+        return _materialize(self) & other
+
+    def __mro_entries__(self, bases):
+        return (_materialize(self),)
+
+    def __repr__(self):
+        name = f"{self.__module__}.{self.__qualname__}"
+        return f"<override of {name!r} with {', '.join(self.__overrides__)}>"
+
+    __enter__ = _InjectorType.__enter__
+    __exit__ = _InjectorType.__exit__
+    __aenter__ = _InjectorType.__aenter__
+    __aexit__ = _InjectorType.__aexit__
+    __getattr__ = _InjectorType.__getattr__
+    __setattr__ = _InjectorType.__setattr__
+    __delattr__ = _InjectorType.__delattr__
+    __contains__ = _InjectorType.__contains__
+    __dir__ = _InjectorType.__dir__
+
+
+def resolve(injector, *attrnames):
+    """Resolve many attributes of the `Injector` subclass in the same scope.
+
+    Dependencies shared between resolved attributes would be built once.
+
+    """
+    _check_injector(injector, "resolve")
+    scope = _scope(injector)
+    delegate = _Delegate(injector.__name__, injector.__dependencies__, scope)
+    try:
+        return tuple(getattr(delegate, attrname) for attrname in attrnames)
+    finally:
+        _release(scope)
+
+
+async def aresolve(injector, *attrnames):
+    """Resolve many attributes of the `Injector` subclass in the same scope.
+
+    Coroutine functions decorated with `@value` would be awaited. Independent
+    branches of the dependency graph would be awaited concurrently. Scope of open
+    `async with` statement could be passed instead of the `Injector` subclass.
+
+    """
+    if isinstance(injector, _DelegateMethods):
+        return await _aresolve(injector.__graph__, injector.__scope__, attrnames)
+    _check_injector(injector, "aresolve")
+    scope = _scope(injector)
+    try:
+        return await _aresolve(injector.__dependencies__, scope, attrnames)
+    finally:
+        _release(scope)
+
+
+async def _aresolve(graph, scope, attrnames):
+    tasks = _tasks(scope)
+    resolvers = [_Resolver(graph, scope.__cache__, name, _forget) for name in attrnames]
+    results = [ensure_future(resolver.aresolve(tasks)) for resolver in resolvers]
+    await _wait(results)
+    for attrname in attrnames:
+        graph.get(attrname).resolved()
+        graph.touch(attrname)
+    return tuple(result.result() for result in results)
+
+
+def _override(injector, overrides):
+    _check_extension_scope((injector,), overrides)
+    key = (injector, _identity(overrides))
+    result = _overrides.get(key)
+    if result is None:
+        result = _Override(injector, overrides)
+        _overrides[key] = result
+    return result
+
+
+def _materialize(override):
+    key = (override.__injector__, _identity(override.__overrides__))
+    return _memoize(_materialized, key, _subclass, override)
+
+
+def _subclass(override):
+    overrides = dict(override.__overrides__)
+    return type(override.__name__, (override.__injector__,), overrides)
+
+
+def _compose(cls, other):
+    return type(cls.__name__, resolve_bases((cls, other)), {})
+
+
+def _memoize(cache, key, function, *args):
+    result = cache.get(key)
+    if result is None:
+        result = function(*args)
+        cache[key] = result
+        _recent.append(result)
+    return result
+
+
+def _identity(overrides):
+    return tuple((name, _key(value)) for name, value in overrides.items())
+
+
+def _key(value):
+    # Type keeps equal values like 1, True and 1.0 apart. Overrides hold their
+    # unhashable values, so identifiers could not be reused.
+    try:
+        hash(value)
+    except TypeError:
+        return id(value)
+    return type(value), value
+
+
+def _scope(cls):
+    return _Scope(cls.__name__, cls.__dependencies__, lambda graph, cache: None)
+
+
+def _check_injector(injector, function):
+    if not isinstance(injector, (_InjectorType, _Override)):
+        message = f"{function!r} function can be used on Injector subclasses only"
+        raise DependencyError(message)
 
 
 def _transfer(source, destination):
-    for attr in ("__module__", "__doc__", "__weakref__", "__qualname__"):
+    for attr in (
+        "__module__",
+        "__doc__",
+        "__weakref__",
+        "__qualname__",
+        "__orig_bases__",
+    ):
         if attr in source:
             destination[attr] = source.pop(attr)
 
@@ -74,6 +272,20 @@ def _check_extension_scope(bases, namespace):
         raise DependencyError("Extension scope can not be empty")
 
 
+_overrides = WeakValueDictionary()
+
+
+_compositions = WeakValueDictionary()
+
+
+_materialized = WeakValueDictionary()
+
+
+# Composed classes live in reference cycles. Keep the recent ones referenced, so they
+# would not be collected between two compositions of the same injectors.
+_recent = deque(maxlen=128)
+
+
 class Injector(metaclass=_InjectorType):
     """Default dependencies specification DSL.
 
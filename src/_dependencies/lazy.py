@@ -2,14 +2,14 @@ from _dependencies.graph import _Graph
 
 
 class _LazyGraph:
+    __slots__ = ("attrname", "namespace")
+
     def __init__(self, attrname, namespace):
         self.attrname = attrname
         self.namespace = namespace
 
     def __get__(self, instance, owner):
-        graph = _Graph()
-        for base in reversed(owner.__bases__):
-            graph.update(base.__dependencies__)
+        graph = _Graph(tuple(base.__dependencies__ for base in owner.__bases__))
         for name, dependency in self.namespace.items():
             graph.assign(name, dependency)
         type.__setattr__(owner, self.attrname, graph)
@@ -0,0 +1,23 @@
+from argparse import ArgumentParser
+
+from _dependencies.warmup import warmup
+
+
+def _main(argv=None):
+    parser = ArgumentParser(prog="python -m dependencies")
+    commands = parser.add_subparsers(dest="command", required=True)
+    command = commands.add_parser("warmup", help=_warmup_help)
+    command.add_argument("packages", nargs="+", metavar="package")
+    arguments = parser.parse_args(argv)
+    total = 0
+    for package in arguments.packages:
+        for name, seconds in warmup(package).items():
+            print(f"{seconds * 1000:10.2f} ms  {name}")
+            total += seconds
+    print(f"{total * 1000:10.2f} ms  total")
+
+
+# Messages.
+
+
+_warmup_help = "analyze every Injector subclass defined in given packages"
@@ -2,6 +2,8 @@ from _dependencies.spec import _Spec
 
 
 class _Attributes:
+    __slots__ = ("origin", "attrs")
+
     def __init__(self, origin, attrs):
         self.origin = origin
         self.attrs = attrs
@@ -20,10 +22,13 @@ def _build_attributes_spec(name, dependency):
         origin_spec.optional,
         _AttributesResolve(origin_spec.factory, dependency.attrs, origin_spec.resolve),
         False,
+        False,
     )
 
 
 class _AttributesFactory:
+    __slots__ = ("factory", "attrs")
+
     def __init__(self, factory, attrs):
         self.factory = factory
         self.attrs = attrs
@@ -36,6 +41,8 @@ class _AttributesFactory:
 
 
 class _AttributesResolve:
+    __slots__ = ("factory", "attrs", "resolve")
+
     def __init__(self, factory, attrs, resolve):
         self.factory = factory
         self.attrs = attrs
@@ -12,14 +12,14 @@ def _is_class(name, dependency):
 
 def _build_class_spec(name, dependency):
     if _using_object_init(dependency):
-        return _Spec(_ClassFactory(dependency), {}, set(), set(), lambda: None, False)
+        factory = _ClassFactory(dependency)
+        return _Spec(factory, {}, set(), set(), _resolve_class, False, False)
     else:
         name = dependency.__name__ + "." + "__init__"
         owner = f"{dependency.__name__!r} class"
         args, required, optional = _method_args(dependency.__init__, name, owner)
-        return _Spec(
-            _ClassFactory(dependency), args, required, optional, lambda: None, False
-        )
+        factory = _ClassFactory(dependency)
+        return _Spec(factory, args, required, optional, _resolve_class, False, False)
 
 
 def _using_object_init(cls):
@@ -31,6 +31,8 @@ def _using_object_init(cls):
 
 
 class _ClassFactory:
+    __slots__ = ("cls",)
+
     def __init__(self, cls):
         self.cls = cls
 
@@ -42,6 +44,10 @@ class _ClassFactory:
         return self.cls(**kwargs), None
 
 
+def _resolve_class():
+    return None
+
+
 # Messages.
 
 
@@ -6,4 +6,19 @@ def _is_data(name, dependency):
 
 
 def _build_data_spec(name, dependency):
-    return _Spec(lambda: (dependency, None), {}, set(), set(), lambda: "Scalar", False)
+    factory = _DataFactory(dependency)
+    return _Spec(factory, {}, set(), set(), _resolve_data, False, False)
+
+
+class _DataFactory:
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self):
+        return self.value, None
+
+
+def _resolve_data():
+    return "Scalar"
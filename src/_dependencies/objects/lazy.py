@@ -0,0 +1,134 @@
+from _dependencies.exceptions import DependencyError
+from _dependencies.scope import _Scope
+from _dependencies.spec import _Spec
+
+
+class Lazy:
+    """Postpone dependency injection until the first attribute access.
+
+    Dependent classes receive a proxy object instead.
+
+    """
+
+    def __init__(self, dependency):
+        self.dependency = dependency
+
+
+lazy = Lazy
+
+
+def _is_lazy(name, dependency):
+    return isinstance(dependency, Lazy)
+
+
+def _build_lazy_spec(name, dependency):
+    spec = yield dependency.dependency
+    _check_context(spec)
+    _check_singleton(spec)
+    return _Spec(
+        _LazyFactory(spec.factory, spec.args),
+        {"__self__": False},
+        {"__self__"},
+        set(),
+        spec.resolve,
+        False,
+        False,
+    )
+
+
+class _LazyFactory:
+    __slots__ = ("factory", "args")
+
+    def __init__(self, factory, args):
+        self.factory = factory
+        self.args = args
+
+    def __call__(self, __self__):
+        scope = __self__()
+        proxy = _Proxy(self.factory, self.args, scope)
+        if scope.__lazy__ is None:
+            scope.__lazy__ = []
+        scope.__lazy__.append(proxy)
+        return proxy, None
+
+
+class _Proxy:
+    __slots__ = ("__factory__", "__args__", "__scope__", "__resolved__")
+
+    def __init__(self, factory, args, scope):
+        object.__setattr__(self, "__factory__", factory)
+        object.__setattr__(self, "__args__", args)
+        object.__setattr__(self, "__scope__", scope)
+        object.__setattr__(self, "__resolved__", None)
+
+    def __getattr__(self, attrname):
+        return getattr(_resolve(self), attrname)
+
+    def __setattr__(self, attrname, value):
+        setattr(_resolve(self), attrname, value)
+
+    def __delattr__(self, attrname):
+        delattr(_resolve(self), attrname)
+
+    def __repr__(self):
+        return repr(_resolve(self))
+
+
+def _resolve(proxy):
+    scope = object.__getattribute__(proxy, "__scope__")
+    if scope is not None:
+        factory = object.__getattribute__(proxy, "__factory__")
+        args = object.__getattribute__(proxy, "__args__")
+        start = len(scope.__lazy__ or ())
+        kwargs = {arg: getattr(scope, arg) for arg in _required(scope, args)}
+        _release(scope, start)
+        resolved, destructor = factory(**kwargs)
+        object.__setattr__(proxy, "__resolved__", resolved)
+        # Scope holds the proxy in its cache.
+        object.__setattr__(proxy, "__scope__", None)
+    return object.__getattribute__(proxy, "__resolved__")
+
+
+def _release(scope, start=0):
+    # Scope cache holds objects which hold the proxy. Once the scope is not used
+    # anymore, untouched proxies keep only values they could need later.
+    if scope.__lazy__ is None:
+        return
+    proxies = scope.__lazy__[start:]
+    del scope.__lazy__[start:]
+    for proxy in proxies:
+        if object.__getattribute__(proxy, "__scope__") is not None:
+            object.__setattr__(proxy, "__scope__", _detach(proxy, scope))
+
+
+def _detach(proxy, scope):
+    graph = scope.__graph__
+    cache = scope.__cache__
+    names = {name for name in cache if name.startswith("__")}
+    for arg in _required(scope, object.__getattribute__(proxy, "__args__")):
+        try:
+            plan = graph.plan(scope, arg)
+        except DependencyError:
+            continue
+        names.add(arg)
+        names.update(plan.names)
+    names.discard("__self__")
+
+    def initialize(graph, detached):
+        detached.update((name, cache[name]) for name in names if name in cache)
+
+    return _Scope(type(scope).__name__, graph, initialize)
+
+
+def _required(scope, args):
+    return [arg for arg, default in args.items() if not default or arg in scope]
+
+
+def _check_context(spec):
+    if spec.is_context:
+        raise DependencyError("'lazy' can not be used on @value generators")
+
+
+def _check_singleton(spec):
+    if spec.is_singleton:
+        raise DependencyError("'lazy' can not be used on 'singleton' objects")
@@ -6,8 +6,12 @@ class _InjectorTypeType(type):
     pass
 
 
+class _IsOverride:
+    __slots__ = ()
+
+
 def _is_nested_injector(name, dependency):
-    return isinstance(dependency, _InjectorTypeType)
+    return isinstance(dependency, (_InjectorTypeType, _IsOverride))
 
 
 def _build_nested_injector_spec(name, dependency):
@@ -16,19 +20,25 @@ def _build_nested_injector_spec(name, dependency):
         {"__self__": False},
         {"__self__"},
         set(),
-        lambda: "'Injector'",
+        _resolve_nested_injector,
+        False,
         False,
     )
 
 
 class _NestedInjectorFactory:
+    __slots__ = ("injector",)
+
     def __init__(self, injector):
         self.injector = injector
 
     def __call__(self, __self__):
-        parent = _Spec(
-            lambda: (__self__, None), {}, set(), set(), lambda: "'Injector'", False
-        )
-        graph = self.injector.__dependencies__.copy()
-        graph.specs["__parent__"] = parent
-        return _Scope(self.injector.__name__, graph, lambda graph, cache: None), None
+        def initialize(graph, cache):
+            cache["__parent__"] = __self__()
+
+        graph = self.injector.__dependencies__
+        return _Scope(self.injector.__name__, graph, initialize), None
+
+
+def _resolve_nested_injector():
+    return "'Injector'"
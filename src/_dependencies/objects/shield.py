@@ -28,10 +28,14 @@ def _build_shield_spec(name, dependency):
         spec_required |= vararg_spec.required
         spec_optional |= vararg_spec.optional
     factory = _ShieldFactory(dependency.callback, varargs_factories)
-    return _Spec(factory, spec_args, spec_required, spec_optional, lambda: None, False)
+    return _Spec(
+        factory, spec_args, spec_required, spec_optional, _resolve_shield, False, False
+    )
 
 
 class _ShieldFactory:
+    __slots__ = ("callback", "args_factories")
+
     def __init__(self, callback, args_factories):
         self.callback = callback
         self.args_factories = args_factories
@@ -42,3 +46,7 @@ class _ShieldFactory:
             arg, destructor = factory(**kwargs)
             args.append(arg)
         return self.callback(*args), None
+
+
+def _resolve_shield():
+    return None
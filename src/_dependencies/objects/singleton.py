@@ -0,0 +1,72 @@
+from _dependencies.exceptions import DependencyError
+from _dependencies.spec import _Spec
+
+
+class Singleton:
+    """Build dependency once per `Injector` subclass.
+
+    The result is shared by every later attribute access.
+
+    """
+
+    def __init__(self, dependency):
+        self.dependency = dependency
+
+
+singleton = Singleton
+
+
+def _is_singleton(name, dependency):
+    return isinstance(dependency, Singleton)
+
+
+def _build_singleton_spec(name, dependency):
+    spec = yield dependency.dependency
+    _check_context(spec)
+    _check_scope(spec)
+    return _Spec(
+        spec.factory,
+        spec.args,
+        spec.required,
+        spec.optional,
+        spec.resolve,
+        False,
+        True,
+    )
+
+
+class _SingletonFactory:
+    __slots__ = ("graph", "name", "factory")
+
+    def __init__(self, graph, name, factory):
+        self.graph = graph
+        self.name = name
+        self.factory = factory
+
+    def __call__(self, **kwargs):
+        with self.graph.lock:
+            if self.name not in self.graph.singletons:
+                result, destructor = self.factory(**kwargs)
+                self.graph.singletons[self.name] = result
+                self.graph.forget(self.name)
+        return self.graph.singletons[self.name], None
+
+
+def _check_context(spec):
+    if spec.is_context:
+        raise DependencyError("'singleton' can not be used on @value generators")
+
+
+def _check_scope(spec):
+    if "__self__" in spec.args:
+        raise DependencyError(singleton_scope_template)
+
+
+# Messages.
+
+
+singleton_scope_template = """
+'singleton' can not be used on 'this' objects and nested injectors.
+
+They depend on the scope of the attribute access.
+""".strip()
@@ -1,6 +1,11 @@
+from itertools import takewhile
 from warnings import warn
 
 from _dependencies.exceptions import DependencyError
+from _dependencies.resolve import _forget
+from _dependencies.resolve import _Resolver
+from _dependencies.scope import _IsScope
+from _dependencies.scope import _tasks
 from _dependencies.spec import _Spec
 
 
@@ -45,22 +50,47 @@ def _build_this_spec(name, dependency):
         {"__self__": False},
         {"__self__"},
         set(),
-        lambda: "'this'",
+        _resolve_this,
+        False,
         False,
     )
 
 
 class _ThisFactory:
+    __slots__ = ("expression",)
+
     def __init__(self, expression):
         self.expression = expression
 
     def __call__(self, __self__):
         operators = {".": _get_attribute, "[]": _get_item}
-        result = __self__
+        result = __self__()
         for operator, symbol in self.expression:
             result = operators[operator](result, symbol)
         return result, None
 
+    async def start(self, __self__):
+        await _prefetch(__self__(), self.expression)
+        return self(__self__)
+
+
+async def _prefetch(scope, expression):
+    # Coroutine functions should be awaited before the expression would reach them.
+    for operator, symbol in takewhile(_is_attribute, expression):
+        if symbol == "__parent__":
+            scope = scope.__cache__.get("__parent__")
+        elif symbol in scope:
+            resolver = _Resolver(scope.__graph__, scope.__cache__, symbol, _forget)
+            scope = await resolver.aresolve(_tasks(scope))
+        else:
+            return
+        if not isinstance(scope, _IsScope):
+            return
+
+
+def _is_attribute(operation):
+    return operation[0] == "."
+
 
 def _get_attribute(instance, name):
     try:
@@ -84,3 +114,7 @@ def _check_expression(expression):
         if operator == "." and symbol != "__parent__"
     ):
         raise DependencyError("You can not use 'this' directly in the 'Injector'")
+
+
+def _resolve_this():
+    return "'this'"
@@ -1,4 +1,6 @@
+from inspect import isasyncgenfunction
 from inspect import isclass
+from inspect import iscoroutinefunction
 from inspect import isgeneratorfunction
 
 from _dependencies.exceptions import DependencyError
@@ -28,7 +30,7 @@ def _is_value(name, dependency):
 
 
 def _is_context(function):
-    return isgeneratorfunction(function)
+    return isgeneratorfunction(function) or isasyncgenfunction(function)
 
 
 def _build_value_spec(name, dependency):
@@ -37,16 +39,24 @@ def _build_value_spec(name, dependency):
     owner = f"{name!r} value"
     args, required, optional = _function_args(function, name, owner)
     _check_method(args)
-    if _is_context(function):
+    if isasyncgenfunction(function):
+        factory = _AsyncContextFactory(function)
+        is_context = True
+    elif _is_context(function):
         factory = _ContextFactory(function)
         is_context = True
+    elif iscoroutinefunction(function):
+        factory = _AsyncValueFactory(function)
+        is_context = False
     else:
         factory = _ValueFactory(function)
         is_context = False
-    return _Spec(factory, args, required, optional, lambda: "'value'", is_context)
+    return _Spec(factory, args, required, optional, _resolve_value, is_context, False)
 
 
 class _ValueFactory:
+    __slots__ = ("function",)
+
     def __init__(self, function):
         self.function = function
 
@@ -55,6 +65,8 @@ class _ValueFactory:
 
 
 class _ContextFactory:
+    __slots__ = ("function",)
+
     def __init__(self, function):
         self.function = function
 
@@ -64,6 +76,8 @@ class _ContextFactory:
 
 
 class _Finalizer:
+    __slots__ = ("generator",)
+
     def __init__(self, generator):
         self.generator = generator
 
@@ -74,6 +88,51 @@ class _Finalizer:
             pass
 
 
+class _AsyncFactory:
+    __slots__ = ("function",)
+
+    def __init__(self, function):
+        self.function = function
+
+
+class _AsyncValueFactory(_AsyncFactory):
+    __slots__ = ()
+
+    def __call__(self, **kwargs):
+        name = self.function.__name__
+        message = f"{name!r} coroutine function could be resolved by 'aresolve'"
+        raise DependencyError(f"{message} function only")
+
+    async def start(self, **kwargs):
+        return await self.function(**kwargs), None
+
+
+class _AsyncContextFactory(_AsyncFactory):
+    __slots__ = ()
+
+    def __call__(self, **kwargs):
+        name = self.function.__name__
+        message = f"{name!r} async generator could be used in 'async with' statement"
+        raise DependencyError(f"{message} only")
+
+    async def start(self, **kwargs):
+        generator = self.function(**kwargs)
+        return await generator.__anext__(), _AsyncFinalizer(generator)
+
+
+class _AsyncFinalizer:
+    __slots__ = ("generator",)
+
+    def __init__(self, generator):
+        self.generator = generator
+
+    async def __call__(self):
+        try:
+            await self.generator.__anext__()
+        except StopAsyncIteration:
+            pass
+
+
 def _check_class(function):
     if isclass(function):
         raise DependencyError("'value' decorator can not be used on classes")
@@ -82,3 +141,7 @@ def _check_class(function):
 def _check_method(arguments):
     if "self" in arguments:
         raise DependencyError("'value' decorator can not be used on methods")
+
+
+def _resolve_value():
+    return "'value'"
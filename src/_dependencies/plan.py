@@ -0,0 +1,94 @@
+from _dependencies.exceptions import DependencyError
+from _dependencies.objects.data import _DataFactory
+from _dependencies.state import _State
+from _dependencies.trace import _Trace
+
+
+class _Plan:
+    __slots__ = ("steps", "seeds", "names", "builder")
+
+    def __init__(self, steps, seeds):
+        self.steps = steps
+        self.seeds = seeds
+        self.names = {step.name for step in steps}
+        self.builder = None
+
+    def required(self, cache):
+        if self.names.isdisjoint(cache):
+            return self.steps
+        needed = {self.steps[-1].name}
+        steps = []
+        for step in reversed(self.steps):
+            if step.name in needed and step.name not in cache:
+                needed.update(step.args)
+                steps.append(step)
+        steps.reverse()
+        return steps
+
+    def failed(self, cache):
+        return next(step for step in self.steps if step.name not in cache)
+
+
+class _Step:
+    __slots__ = ("name", "args", "path")
+
+    def __init__(self, name, args, path):
+        self.name = name
+        self.args = args
+        self.path = path
+
+
+class _Planner:
+    __slots__ = ("graph", "scope", "state", "attrname", "steps", "seeds")
+
+    def __init__(self, graph, scope, attrname):
+        self.graph = graph
+        self.scope = scope
+        known = {"__self__": scope, **graph.values, **graph.known()}
+        self.state = _State(known, attrname)
+        self.attrname = attrname
+        self.steps = []
+        self.seeds = {}
+
+    def plan(self):
+        while self.attrname not in self.state.cache:
+            spec = self.graph.get(self.state.current)
+            if self.is_optional(spec) or self.is_constant(spec):
+                continue
+            argument = self.state.match(spec.args)
+            if argument is None:
+                self.add(spec.args)
+            else:
+                self.state.add(*argument)
+        return _Plan(self.steps, self.seeded())
+
+    def is_optional(self, spec):
+        if spec is not None:
+            return False
+        if self.state.have_default:
+            self.state.pop()
+            return True
+        message = _Trace(self.scope, self.state.path())
+        message.add(f"Can not resolve attribute {self.state.current!r}")
+        raise DependencyError(message)
+
+    def is_constant(self, spec):
+        if not isinstance(spec.factory, _DataFactory):
+            return False
+        self.seeds[self.state.current] = spec.factory.value
+        self.state.store(spec.factory.value)
+        return True
+
+    def add(self, args):
+        arguments = self.state.arguments(args)
+        self.steps.append(_Step(self.state.current, arguments, self.state.path()))
+        self.state.store(None)
+
+    def seeded(self):
+        names = {self.attrname}
+        for step in self.steps:
+            names.update(step.args)
+        known = self.graph.known()
+        for name in names & known.keys():
+            self.seeds[name] = known[name]
+        return self.seeds
@@ -1,56 +1,96 @@
+from asyncio import ensure_future
+from asyncio import gather
+
 from _dependencies.exceptions import DependencyError
-from _dependencies.state import _State
 from _dependencies.trace import _Trace
 
 
 class _Resolver:
+    __slots__ = ("graph", "cache", "attrname", "remember")
+
     def __init__(self, graph, cache, attrname, remember):
         self.graph = graph
-        self.state = _State(cache, attrname)
+        self.cache = cache
         self.attrname = attrname
         self.remember = remember
 
     def resolve(self):
-        try:
-            return self.find()
-        except RecursionError:
-            message = _Trace(self.state)
-            message.add("Circle error found in definition of the dependency graph")
-            raise DependencyError(message) from None
-
-    def find(self):
-        while self.attrname not in self.state.cache:
-            spec = self.graph.get(self.state.current)
-            if self.is_optional(spec):
-                continue
-            if self.state.resolved(spec.required, spec.optional):
-                self.create(spec.factory, spec.args)
+        if self.attrname not in self.cache:
+            plan = self.graph.plan(self.cache["__self__"](), self.attrname)
+            self.cache.update(plan.seeds)
+            if plan.builder is not None and plan.names.isdisjoint(self.cache):
+                self.build(plan)
             else:
-                self.match(spec.args)
-        return self.state.cache[self.attrname]
-
-    def is_optional(self, spec):
-        if spec is not None:
-            return False
-        if self.state.have_default:
-            self.state.pop()
-            return True
-        message = _Trace(self.state)
-        message.add(f"Can not resolve attribute {self.state.current!r}")
-        raise DependencyError(message)
-
-    def create(self, factory, args):
+                for step in plan.required(self.cache):
+                    if step.name not in self.cache:
+                        self.create(step)
+        return self.cache[self.attrname]
+
+    async def aresolve(self, tasks):
+        if self.attrname not in self.cache:
+            plan = self.graph.plan(self.cache["__self__"](), self.attrname)
+            self.cache.update(plan.seeds)
+            steps = plan.required(self.cache)
+            for step in steps:
+                if step.name not in tasks:
+                    args = [tasks[arg] for arg in step.args if arg in tasks]
+                    tasks[step.name] = ensure_future(self.acreate(step, args))
+            await _wait([tasks[step.name] for step in steps])
+        return self.cache[self.attrname]
+
+    def build(self, plan):
         try:
-            result, destructor = factory(**self.state.kwargs(args))
-            self.state.store(result)
-            self.remember(destructor)
+            plan.builder(self.graph, self.cache, self.remember)
         except DependencyError as error:
-            message = _Trace(self.state)
-            message.add(error)
-            raise DependencyError(message) from None
-
-    def match(self, args):
-        for arg, have_default in args.items():  # pragma: no branch
-            if self.state.should(arg, have_default):
-                self.state.add(arg, have_default)
-                break
+            raise DependencyError(self.trace(plan.failed(self.cache), error)) from None
+
+    def create(self, step):
+        factory = self.graph.factory(step.name)
+        try:
+            result, destructor = factory(**{arg: self.cache[arg] for arg in step.args})
+        except DependencyError as error:
+            raise DependencyError(self.trace(step, error)) from None
+        self.cache[step.name] = result
+        self.remember(destructor)
+
+    async def acreate(self, step, args):
+        await gather(*args)
+        if step.name in self.cache:
+            return
+        factory = self.graph.factory(step.name)
+        start = getattr(factory, "start", None)
+        if start is None or self.unclosed(step):
+            self.create(step)
+            return
+        kwargs = {arg: self.cache[arg] for arg in step.args}
+        try:
+            result, destructor = await start(**kwargs)
+        except DependencyError as error:
+            raise DependencyError(self.trace(step, error)) from None
+        self.cache[step.name] = result
+        self.remember(destructor)
+
+    def unclosed(self, step):
+        # Async generators would be started without `async with` statement to close
+        # them. Their factories report the error once called the regular way.
+        return self.remember is _forget and self.graph.get(step.name).is_context
+
+    def trace(self, step, error):
+        message = _Trace(self.cache["__self__"](), step.path)
+        message.add(error)
+        return message
+
+
+async def _wait(tasks):
+    # Independent branches are awaited concurrently, the first error stops the rest.
+    try:
+        await gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _forget(destructor):
+    pass
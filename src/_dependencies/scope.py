@@ -1,16 +1,44 @@
+from functools import lru_cache
+from weakref import ref
+
+from _dependencies.resolve import _forget
 from _dependencies.resolve import _Resolver
 
 
 class _IsScope:
-    pass
+    __slots__ = ()
 
 
 class _Scope:
     def __new__(cls, name, graph, initialize):
-        def getattr_method(self, attrname):
-            return _Resolver(graph, cache, attrname, lambda descriptor: None).resolve()
-
-        instance = type(name, (_IsScope,), {"__getattr__": getattr_method})()
-        cache = {"__self__": instance}
+        instance = _scope_class(name)()
+        # Scope referenced weakly could be freed without garbage collector.
+        cache = {"__self__": ref(instance), **graph.values}
+        instance.__graph__ = graph
+        instance.__cache__ = cache
+        instance.__lazy__ = None
+        instance.__tasks__ = None
         initialize(graph, cache)
         return instance
+
+
+class _ScopeMethods(_IsScope):
+    __slots__ = ("__graph__", "__cache__", "__lazy__", "__tasks__", "__weakref__")
+
+    def __getattr__(self, attrname):
+        return _Resolver(self.__graph__, self.__cache__, attrname, _forget).resolve()
+
+    def __contains__(self, attrname):
+        return self.__graph__.has(attrname)
+
+
+@lru_cache(maxsize=None)
+def _scope_class(name):
+    return type(name, (_ScopeMethods,), {"__slots__": ()})
+
+
+def _tasks(scope):
+    # Only `aresolve` function and `async with` statement await steps of the scope.
+    if scope.__tasks__ is None:
+        scope.__tasks__ = {}
+    return scope.__tasks__
@@ -2,16 +2,29 @@ from _dependencies.exceptions import DependencyError
 
 
 class _Spec:
-    def __init__(self, factory, args, required, optional, resolve, is_context):
+    __slots__ = (
+        "factory",
+        "args",
+        "required",
+        "optional",
+        "resolve",
+        "is_context",
+        "is_singleton",
+    )
+
+    def __init__(
+        self, factory, args, required, optional, resolve, is_context, is_singleton
+    ):
         _validate_factory(factory)
         _validate_args(args, required, optional)
         _validate_resolve(resolve)
         self.factory = factory
         self.args = args
-        self.required = required
-        self.optional = optional
+        self.required = frozenset(required)
+        self.optional = frozenset(optional)
         self.resolve = resolve
         self.is_context = is_context
+        self.is_singleton = is_singleton
 
     def resolved(self):
         kind = self.resolve()
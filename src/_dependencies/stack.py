@@ -1,15 +1,48 @@
+from contextvars import ContextVar
+
 from _dependencies.enclose import _Enclose
+from _dependencies.exceptions import DependencyError
 
 
 class _Stack:
+    __slots__ = ("opened",)
+
     def __init__(self):
-        self.queue = []
+        self.opened = []
 
     def add(self):
         enclose = _Enclose()
-        self.queue.append(enclose)
+        queues = _queues.get()
+        _queues.set({**queues, self: (*queues.get(self, ()), enclose)})
+        self.opened.append(enclose)
         return enclose
 
     def remove(self):
-        enclose = self.queue.pop()
+        enclose = self.pop()
         enclose.after()
+
+    async def aremove(self):
+        enclose = self.pop()
+        await enclose.aafter()
+
+    def pop(self):
+        queues = dict(_queues.get())
+        queue = [enclose for enclose in queues.pop(self, ()) if enclose in self.opened]
+        if queue:
+            enclose = queue.pop()
+        elif self.opened:
+            # Statement was entered in another asyncio task or context. Frameworks
+            # do so with dependencies and fixtures which yield.
+            enclose = self.opened[-1]
+        else:
+            raise DependencyError("'with' statement was left without being entered")
+        if queue:
+            queues[self] = tuple(queue)
+        _queues.set(queues)
+        self.opened.remove(enclose)
+        return enclose
+
+
+# Every thread and asyncio task sees its own `with` statements. Mapping is never
+# changed in place, since tasks share it with the context they were copied from.
+_queues = ContextVar("queues", default={})
@@ -2,22 +2,26 @@ from collections import deque
 
 
 class _State:
+    __slots__ = ("cache", "tried", "stack", "current", "have_default", "pending")
+
     def __init__(self, cache, attrname):
         self.cache = cache
         self.tried = set()
         self.stack = deque()
         self.current = attrname
         self.have_default = False
+        self.pending = None
 
     def add(self, current, have_default):
-        self.stack.append((self.current, self.have_default))
+        self.stack.append((self.current, self.have_default, self.pending))
         self.current = current
         self.have_default = have_default
+        self.pending = None
 
     def pop(self):
         self.tried.add(self.current)
         try:
-            self.current, self.have_default = self.stack.pop()
+            self.current, self.have_default, self.pending = self.stack.pop()
         except IndexError:
             pass
 
@@ -25,13 +29,18 @@ class _State:
         self.cache[self.current] = value
         self.pop()
 
-    def resolved(self, required, optional):
-        has_required = required <= self.cache.keys()
-        tried_optional = optional <= self.tried
-        return has_required and tried_optional
+    def match(self, args):
+        if self.pending is None:
+            self.pending = iter(args.items())
+        for arg, have_default in self.pending:
+            if self.should(arg, have_default):
+                return arg, have_default
+
+    def arguments(self, args):
+        return tuple(k for k in args if k in self.cache)
 
-    def kwargs(self, args):
-        return {k: self.cache[k] for k in args if k in self.cache}
+    def path(self):
+        return (*[s[0] for s in self.stack], self.current)
 
     def should(self, arg, have_default):
-        return arg not in self.tried or (arg not in self.cache and not have_default)
+        return arg not in self.cache and (arg not in self.tried or not have_default)
@@ -0,0 +1,112 @@
+import json
+import os
+from hashlib import sha256
+from tempfile import NamedTemporaryFile
+from threading import RLock
+
+
+def cache_directory(path):
+    """Store analysis results of function signatures in the given directory.
+
+    Entries are grouped by the source file of the function and would be used
+    while the size and modification time of that file stay the same. Pass `None`
+    to stop using the directory.
+
+    """
+    with _lock:
+        _storage.flush()
+        _storage.directory = None if path is None else os.fspath(path)
+        _storage.modules.clear()
+
+
+class _Storage:
+    __slots__ = ("directory", "modules", "dirty")
+
+    def __init__(self):
+        self.directory = None
+        self.modules = {}
+        self.dirty = set()
+
+    def load(self, func):
+        with _lock:
+            location = self.locate(func)
+            if location is None:
+                return None
+            filename, key = location
+            return self.entry(filename)["signatures"].get(key)
+
+    def save(self, func, args):
+        with _lock:
+            location = self.locate(func)
+            if location is None:
+                return
+            filename, key = location
+            entry = self.entry(filename)
+            entry["signatures"][key] = args
+            self.dirty.add(filename)
+
+    def flush(self):
+        # Each file is written once for all functions analyzed together.
+        with _lock:
+            for filename in self.dirty:
+                _write(self.path(filename), json.dumps(self.modules[filename]))
+            self.dirty.clear()
+
+    def locate(self, func):
+        if self.directory is None or _is_derived(func):
+            return None
+        code = func.__code__
+        if not os.path.isfile(code.co_filename):
+            return None
+        return code.co_filename, f"{func.__qualname__}:{code.co_firstlineno}"
+
+    def entry(self, filename):
+        stamp = _stamp(filename)
+        entry = self.modules.get(filename)
+        if entry is None or entry["stamp"] != stamp:
+            entry = _read(self.path(filename))
+            if entry is None or entry["stamp"] != stamp:
+                entry = {"stamp": stamp, "signatures": {}}
+            self.modules[filename] = entry
+        return entry
+
+    def path(self, filename):
+        digest = sha256(filename.encode()).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+
+def _is_derived(func):
+    # Signature of decorated functions is defined somewhere else.
+    return hasattr(func, "__wrapped__") or hasattr(func, "__signature__")
+
+
+def _stamp(filename):
+    stat = os.stat(filename)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _read(path):
+    try:
+        with open(path) as stream:
+            return json.load(stream)
+    except (OSError, ValueError):
+        return None
+
+
+def _write(path, snapshot):
+    # Cache is optional, resolution should not fail when it could not be stored.
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with NamedTemporaryFile("w", dir=directory, delete=False) as stream:
+            stream.write(snapshot)
+        os.replace(stream.name, path)
+    except OSError:
+        pass
+
+
+_storage = _Storage()
+
+
+# Graph locks are not shared between injectors analyzed at the same time.
+_lock = RLock()
@@ -2,19 +2,20 @@ from _dependencies.exceptions import DependencyError
 
 
 class _Trace:
-    def __init__(self, state):
-        self.states = [state]
+    __slots__ = ("frames", "error")
+
+    def __init__(self, scope, path):
+        self.frames = [(scope, path)]
 
     def __str__(self):
-        indentation = _Indentation()
-        return self.error + ":\n\n" + "\n".join(map(indentation, self.stack()))
+        return _format(self.error, self.stack())
 
     def add(self, error):
         if isinstance(error, DependencyError):
             message = error.args[0]
             if isinstance(message, _Trace):
                 self.error = message.error
-                self.states.extend(message.states)
+                self.frames.extend(message.frames)
             else:
                 self.error = message
         else:
@@ -22,20 +23,20 @@ class _Trace:
 
     def stack(self):
         attributes = []
-        seen = set()
-        for state in self.states:
-            scope = state.cache["__self__"]
+        for scope, path in self.frames:
             name = scope.__class__.__name__
-            for attribute in [*[s[0] for s in state.stack], state.current]:
-                attributes.append(f"{name}.{attribute}")
-                if (scope, attribute) in seen:
-                    return attributes
-                else:
-                    seen.add((scope, attribute))
+            attributes.extend(f"{name}.{attribute}" for attribute in path)
         return attributes
 
 
+def _format(error, lines):
+    indentation = _Indentation()
+    return error + ":\n\n" + "\n".join(map(indentation, lines))
+
+
 class _Indentation:
+    __slots__ = ("index",)
+
     def __init__(self):
         self.index = 0
 
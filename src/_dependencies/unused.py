@@ -0,0 +1,31 @@
+from _dependencies.circles import _edges
+from _dependencies.circles import _key
+from _dependencies.exceptions import DependencyError
+from _dependencies.objects.nested import _InjectorTypeType
+from _dependencies.objects.nested import _IsOverride
+
+
+def unused(injector, *attrnames):
+    """Report attributes of the `Injector` subclass which are never needed.
+
+    Dependencies are followed from given attributes. Without them, attributes
+    accessed on the `Injector` subclass so far would be used instead.
+
+    """
+    _check_injector(injector)
+    graph = injector.__dependencies__
+    chain = ((injector.__name__, graph),)
+    nodes = [(chain, attrname) for attrname in attrnames or graph.accessed]
+    reached = set()
+    while nodes:
+        node = nodes.pop()
+        if _key(*node) not in reached:
+            reached.add(_key(*node))
+            nodes.extend(_edges(*node))
+    return sorted(name for name in graph.names() if _key(chain, name) not in reached)
+
+
+def _check_injector(injector):
+    if not isinstance(injector, (_InjectorTypeType, _IsOverride)):
+        message = "'unused' function can be used on Injector subclasses only"
+        raise DependencyError(message)
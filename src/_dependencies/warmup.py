@@ -0,0 +1,59 @@
+from importlib import import_module
+from pkgutil import walk_packages
+from time import perf_counter
+
+from _dependencies.exceptions import DependencyError
+from _dependencies.injector import Injector
+from _dependencies.scope import _Scope
+
+
+def warmup(package):
+    """Import the package and analyze every `Injector` subclass defined in it.
+
+    Dependency graphs and resolution plans would be ready before the first
+    attribute access. Attributes which could not be resolved are left to report
+    their error on access, since mixins are allowed to be incomplete.
+
+    Return seconds spent on each `Injector` subclass by its qualified name.
+
+    """
+    _import(package)
+    timings = {}
+    for injector in _subclasses(Injector):
+        if _defined_in(injector, package):
+            start = perf_counter()
+            _warmup(injector)
+            name = f"{injector.__module__}.{injector.__qualname__}"
+            timings[name] = perf_counter() - start
+    return timings
+
+
+def _import(package):
+    module = import_module(package)
+    path = getattr(module, "__path__", ())
+    for info in walk_packages(path, f"{package}."):
+        import_module(info.name)
+
+
+def _subclasses(cls):
+    result = {}
+    for subclass in cls.__subclasses__():
+        result[subclass] = None
+        result.update(_subclasses(subclass))
+    return result
+
+
+def _defined_in(injector, package):
+    module = injector.__module__
+    return module == package or module.startswith(f"{package}.")
+
+
+def _warmup(injector):
+    graph = injector.__dependencies__
+    graph.check()
+    scope = _Scope(injector.__name__, graph, lambda graph, cache: None)
+    for name in graph.names():
+        try:
+            graph.plan(scope, name)
+        except DependencyError:
+            pass
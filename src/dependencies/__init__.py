@@ -1,9 +1,33 @@
 """Constructor injection designed with OOP in mind."""
+from _dependencies.compiled import compiled
+from _dependencies.freeze import freeze
+from _dependencies.injector import aresolve
 from _dependencies.injector import Injector
+from _dependencies.injector import resolve
+from _dependencies.objects.lazy import lazy
 from _dependencies.objects.package import Package
 from _dependencies.objects.shield import shield
+from _dependencies.objects.singleton import singleton
 from _dependencies.objects.this import this
 from _dependencies.objects.value import value
+from _dependencies.storage import cache_directory
+from _dependencies.unused import unused
+from _dependencies.warmup import warmup
 
 
-__all__ = ("Injector", "Package", "this", "value", "shield")
+__all__ = (
+    "Injector",
+    "Package",
+    "this",
+    "value",
+    "shield",
+    "compiled",
+    "singleton",
+    "resolve",
+    "aresolve",
+    "lazy",
+    "freeze",
+    "warmup",
+    "cache_directory",
+    "unused",
+)
@@ -0,0 +1,5 @@
+"""Command line interface of the dependencies library."""
+from _dependencies.main import _main
+
+
+_main()
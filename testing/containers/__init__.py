@@ -0,0 +1,7 @@
+from dependencies import Injector
+
+
+class Settings(Injector):
+    """A dummy container with settings."""
+
+    url = "postgres://"
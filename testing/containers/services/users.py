@@ -0,0 +1,30 @@
+from containers import Settings
+from dependencies import Injector
+
+
+class Connection:
+    """A dummy connection."""
+
+    def __init__(self, url):
+        self.url = url
+
+
+class Repository:
+    """A dummy repository."""
+
+    def __init__(self, connection, limit):
+        self.connection = connection
+
+
+class Users(Settings):
+    """A dummy container with users repository."""
+
+    repository = Repository
+    connection = Connection
+    limit = 10
+
+
+class Mixin(Injector):
+    """A dummy container which is not complete."""
+
+    repository = Repository
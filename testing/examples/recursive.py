@@ -0,0 +1,18 @@
+from _ import examples
+from dependencies import Injector
+from dependencies import this
+
+
+class Container(Injector):
+    """A dummy container."""
+
+    foo = examples.recursive.Nested.foo
+    bar = 1
+
+
+class Nested(Injector):
+    """A dummy container which contains its parent."""
+
+    Container = Container
+    foo = this.Container.bar
+    itself = examples.recursive.Nested
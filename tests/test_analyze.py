@@ -0,0 +1,114 @@
+"""Tests related to dispatch of dependency analysis on the dependency type."""
+import gc
+import weakref
+from enum import Enum
+
+import pytest
+
+from _dependencies.analyze import _builders
+from _dependencies.analyze import _register
+from _dependencies.objects.data import _build_data_spec
+from dependencies import Injector
+from dependencies.exceptions import DependencyError
+
+
+def test_dispatch_hit():
+    """Builder found for the dependency type should be used for the same type."""
+
+    class Foo:
+        def __init__(self, bar, baz):
+            self.bar = bar
+            self.baz = baz
+
+    class Container(Injector):
+        foo = Foo
+        bar = {"x": 1}
+        baz = {"y": 2}
+
+    foo = Container.foo
+    assert foo.bar == {"x": 1}
+    assert foo.baz == {"y": 2}
+    assert dict in _builders
+
+
+def test_dispatch_miss():
+    """Classes with custom metaclasses should be checked by their kind every time."""
+
+    class Color(Enum):
+        red = 1
+
+    class Container(Injector):
+        foo = Color
+
+    for _ in range(2):
+        with pytest.raises(DependencyError):
+            Container.foo
+
+    assert type(Color) not in _builders
+    assert type(Injector) not in _builders
+
+
+def test_dispatch_class_names():
+    """Plain classes should be built, unless the attribute name ends with `_class`."""
+
+    class Foo:
+        def __init__(self, bar_class):
+            self.bar_class = bar_class
+
+    class Bar:
+        pass
+
+    class Container(Injector):
+        foo = Foo
+        bar_class = Bar
+
+    assert Container.foo.bar_class is Bar
+    assert type(Container.foo) is Foo
+
+
+def test_register_builder():
+    """New kinds of dependencies could register their own builder."""
+    built = []
+
+    class Setting:
+        def __init__(self, default):
+            self.default = default
+
+    def build_setting(name, dependency):
+        built.append(name)
+        return _build_data_spec(name, dependency.default)
+
+    class App:
+        def __init__(self, timeout):
+            self.timeout = timeout
+
+    _register(Setting, build_setting)
+
+    class Container(Injector):
+        app = App
+        timeout = Setting(1)
+
+    assert Container.app.timeout == 1
+    assert built == ["timeout"]
+
+
+def test_registry_does_not_keep_types_alive():
+    """Types of dependencies should be freed together with their `Injector`."""
+
+    class App:
+        def __init__(self, cfg):
+            self.cfg = cfg
+
+    cfg_type = type("Cfg", (), {})
+
+    class Container(Injector):
+        app = App
+        cfg = cfg_type()
+
+    assert type(Container.app.cfg) is cfg_type
+    assert cfg_type in _builders
+
+    reference = weakref.ref(cfg_type)
+    del Container, cfg_type
+    gc.collect()
+    assert reference() is None
@@ -0,0 +1,200 @@
+"""Tests related to cache directory function."""
+import os
+import sys
+from importlib.util import module_from_spec
+from importlib.util import spec_from_file_location
+from threading import Barrier
+from threading import Thread
+
+import pytest
+
+from dependencies import cache_directory
+from dependencies import Injector
+
+
+@pytest.fixture()
+def storage(tmp_path):
+    """Use temporary cache directory."""
+    cache_directory(tmp_path / "cache")
+    yield tmp_path / "cache"
+    cache_directory(None)
+
+
+def test_store_signatures(tmp_path, storage):
+    """Store analyzed signatures in the cache directory."""
+    source = _source(tmp_path, "def __init__(self, aa):")
+    Foo = _load(source)
+
+    class Container(Injector):
+        foo = Foo
+        aa = 1
+
+    assert Container.foo.aa == 1
+    assert len(list(storage.iterdir())) == 1
+
+
+def test_write_signatures_once(tmp_path, storage, monkeypatch):
+    """Functions analyzed together would be written to the cache file once."""
+    writes = []
+    replace = os.replace
+    monkeypatch.setattr(os, "replace", lambda *args: writes.append(replace(*args)))
+    source = tmp_path / "foo.py"
+    source.write_text(
+        "class Foo:\n    def __init__(self, bar):\n        self.bar = bar\n"
+        "class Bar:\n    def __init__(self, aa):\n        self.aa = aa\n"
+    )
+    spec = spec_from_file_location("foo", source)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    class Container(Injector):
+        foo = module.Foo
+        bar = module.Bar
+        aa = 1
+
+    assert Container.foo.bar.aa == 1
+    assert len(writes) == 1
+
+
+def test_reuse_signatures(tmp_path, storage):
+    """Signatures would be taken from the cache while source file is the same.
+
+    Cache directory is used again the way the next process would use it.
+
+    """
+    source = _source(tmp_path, "def __init__(self, aa):")
+    _analyze(_load(source))
+    cache_directory(storage)
+    stat = os.stat(source)
+    _source(tmp_path, "def __init__(self, bb):")
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    Foo = _load(source)
+
+    class Container(Injector):
+        foo = Foo
+        aa = 1
+        bb = 2
+
+    with pytest.raises(TypeError):
+        Container.foo
+
+
+def test_rebuild_stale_signatures(tmp_path, storage):
+    """Changed source files should be analyzed again."""
+    source = _source(tmp_path, "def __init__(self, aa):")
+    _analyze(_load(source))
+    _source(tmp_path, "def __init__(self, bb, cc=3):")
+    Foo = _load(source)
+
+    class Container(Injector):
+        foo = Foo
+        aa = 1
+        bb = 2
+
+    assert Container.foo.bb == 2
+    assert Container.foo.cc == 3
+
+
+def test_ignore_broken_cache(tmp_path, storage):
+    """Broken cache files should be replaced."""
+    source = _source(tmp_path, "def __init__(self, aa):")
+    _analyze(_load(source))
+    for path in storage.iterdir():
+        path.write_text("{")
+    Foo = _load(source)
+
+    class Container(Injector):
+        foo = Foo
+        aa = 1
+
+    assert Container.foo.aa == 1
+
+
+def test_ignore_unwritable_cache(tmp_path):
+    """Cache directory which could not be written should not break resolution."""
+    (tmp_path / "file").write_text("")
+    cache_directory(tmp_path / "file" / "cache")
+    try:
+        Foo = _load(_source(tmp_path, "def __init__(self, aa):"))
+
+        class Container(Injector):
+            foo = Foo
+            aa = 1
+
+        assert Container.foo.aa == 1
+    finally:
+        cache_directory(None)
+
+
+def test_store_signatures_from_many_threads(tmp_path, storage):
+    """Injectors analyzed by many threads at once could share the cache file."""
+    source = tmp_path / "many.py"
+    source.write_text(
+        "".join(
+            f"class Foo{i}:\n    def __init__(self, aa):\n        self.aa = aa\n"
+            for i in range(100)
+        )
+    )
+    spec = spec_from_file_location("many", source)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    results = []
+    barrier = Barrier(4)
+
+    def access(number):
+        barrier.wait()
+        for i in range(number, 100, 4):
+
+            class Container(Injector):
+                foo = getattr(module, f"Foo{i}")
+                aa = i
+
+            results.append(Container.foo.aa)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [Thread(target=access, args=(number,)) for number in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert sorted(results) == list(range(100))
+
+
+def test_skip_generated_functions(storage):
+    """Functions without source file should not be stored."""
+    namespace = {}
+    code = "class Foo:\n    def __init__(self, aa):\n        self.aa = aa"
+    exec(code, namespace)  # nosec
+
+    class Container(Injector):
+        foo = namespace["Foo"]
+        aa = 1
+
+    assert Container.foo.aa == 1
+    assert not storage.exists()
+
+
+def _source(directory, line):
+    path = directory / "foo.py"
+    path.write_text(f"class Foo:\n    {line}\n        self.__dict__.update(locals())\n")
+    return path
+
+
+def _load(path):
+    spec = spec_from_file_location("foo", path)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.Foo
+
+
+def _analyze(cls):
+    class Container(Injector):
+        foo = cls
+        aa = 1
+
+    return Container.foo
@@ -0,0 +1,247 @@
+"""Tests related to compiled resolution of dependencies."""
+import pytest
+
+from dependencies import compiled
+from dependencies import Injector
+from dependencies import shield
+from dependencies import this
+from dependencies import value
+from dependencies.exceptions import DependencyError
+
+
+def test_compiled_resolve(e, expect):
+    """Compiled `Injector` subclass should resolve the same graph as regular one."""
+
+    class Root:
+        def __init__(self, a, b, c, d):
+            self.a = a
+            self.b = b
+            self.c = c
+            self.d = d
+
+    class A:
+        def __init__(self, x, y=2):
+            self.x = x
+            self.y = y
+
+    @compiled
+    class Container(Injector):
+        root = Root
+        a = A
+        b = this.Nested.b
+        c = shield(e.StarArgs, this.x, this.w)
+        x = 1
+        w = 3
+
+        @value
+        def d(x, z=4):
+            return x + z
+
+        class Nested(Injector):
+            b = (this << 1).x
+
+    @expect(Container)
+    def to_be(it):
+        root = it.root
+        assert root.a.x == 1
+        assert root.a.y == 2
+        assert root.b == 1
+        assert root.c.args == (1, 3)
+        assert root.d == 5
+
+
+def test_compiled_evaluate_once():
+    """Evaluate each node in the dependencies graph once.
+
+    Dependencies resolved through `this` expressions could already be stored in the
+    scope when compiled function would reach them.
+
+    """
+    times = []
+
+    class Root:
+        def __init__(self, a, b):
+            self.a = a
+            self.b = b
+
+    class B:
+        def __init__(self):
+            times.append(1)
+
+    @compiled
+    class Container(Injector):
+        root = Root
+        a = this.Nested.a
+        b = B
+
+        class Nested(Injector):
+            a = (this << 1).b
+
+    root = Container.root
+    assert root.a is root.b
+    assert sum(times) == 1
+
+
+def test_compiled_setup_and_teardown():
+    """Compiled `Injector` subclass should execute teardown of @value objects."""
+    result = []
+
+    class App:
+        def __init__(self, lock):
+            self.lock = lock
+
+    @compiled
+    class Container(Injector):
+        app = App
+
+        @value
+        def lock():
+            result.append("setup")
+            yield 1
+            result.append("teardown")
+
+    with Container as container:
+        assert container.app.lock == 1
+
+    assert result == ["setup", "teardown"]
+
+
+def test_compiled_error_trace():
+    """Compiled `Injector` subclass should report a place of the error."""
+
+    class Foo:
+        def __init__(self, bar):
+            raise RuntimeError
+
+    class Bar:
+        def __init__(self, baz):
+            raise RuntimeError
+
+    @compiled
+    class Container(Injector):
+        foo = Foo
+        bar = Bar
+        baz = this.Nested.baz
+
+        class Nested(Injector):
+            baz = (this << 2).baz
+
+    with pytest.raises(DependencyError) as exc_info:
+        Container.foo
+
+    expected = """
+You tried to shift this more times than Injector has levels:
+
+Container.foo
+  Container.bar
+    Container.baz
+      Nested.baz
+    """.strip()
+
+    assert str(exc_info.value) == expected
+
+
+def test_compiled_deny_classes_depend_on_nested_injectors():
+    """Compiled classes should not receive nested injectors as arguments."""
+
+    class Foo:
+        def __init__(self, bar):
+            raise RuntimeError
+
+    @compiled
+    class Container(Injector):
+        foo = Foo
+
+        class bar(Injector):
+            baz = None
+
+    with pytest.raises(DependencyError) as exc_info:
+        Container.foo
+
+    expected = """
+Do not depend on nested injectors directly.
+
+Use this object to access inner attributes of nested injector:
+
+Container.foo
+    """.strip()
+
+    assert str(exc_info.value) == expected
+
+
+def test_compiled_circle_dependency_error():
+    """Compiled `Injector` subclass should handle circle definitions.
+
+    Circle definitions are found before the first access of the attribute would
+    build anything.
+
+    """
+
+    class Foo:
+        def __init__(self, bar):
+            raise RuntimeError
+
+    @compiled
+    class Container(Injector):
+        foo = Foo
+        bar = this.SubContainer.bar
+
+        class SubContainer(Injector):
+            bar = (this << 1).foo
+
+    with pytest.raises(DependencyError) as exc_info:
+        Container.foo
+
+    expected = """
+Circle error found in definition of the dependency graph:
+
+Container.foo
+  Container.bar
+    SubContainer.bar
+      Container.foo
+    """.strip()
+
+    assert str(exc_info.value) == expected
+
+
+def test_compiled_subclass():
+    """Subclasses of compiled `Injector` should be compiled as well."""
+
+    class Foo:
+        def __init__(self, bar):
+            self.bar = bar
+
+    @compiled
+    class Container(Injector):
+        foo = Foo
+        bar = 1
+
+    assert Container(bar=2).foo.bar == 2
+
+
+def test_compiled_after_resolve():
+    """`Injector` subclass could be compiled after it was used."""
+
+    class Foo:
+        def __init__(self, bar):
+            self.bar = bar
+
+    class Container(Injector):
+        foo = Foo
+        bar = 1
+
+    assert Container.foo.bar == 1
+    assert compiled(Container).foo.bar == 1
+
+
+def test_compiled_protect_against_classes():
+    """Deny to apply `compiled` to regular classes."""
+    with pytest.raises(DependencyError) as exc_info:
+
+        @compiled
+        class Foo:
+            pass
+
+    expected = "'compiled' decorator can be used on Injector subclasses only"
+
+    assert str(exc_info.value) == expected
@@ -1,7 +1,12 @@
 """Tests related to direct resolve rules."""
+import asyncio
+
 import pytest
 
+from dependencies import aresolve
 from dependencies import Injector
+from dependencies import resolve
+from dependencies import shield
 from dependencies import this
 from dependencies import value
 from dependencies.exceptions import DependencyError
@@ -110,3 +115,366 @@ def test_direct_package_class_resolve(expect):
     @expect(Container)
     def to_be(it):
         assert isinstance(it.foo, Foo)
+
+
+def test_resolve_many_attributes():
+    """Resolve many attributes in the same scope.
+
+    Dependencies shared between attributes should be built once.
+
+    """
+    times = []
+
+    class Connection:
+        def __init__(self):
+            times.append(1)
+
+    class Users:
+        def __init__(self, connection):
+            self.connection = connection
+
+    class Orders:
+        def __init__(self, connection, limit):
+            self.connection = connection
+
+    class Container(Injector):
+        users = Users
+        orders = Orders
+        connection = Connection
+        limit = 10
+
+    users, orders = resolve(Container, "users", "orders")
+    assert users.connection is orders.connection
+    assert sum(times) == 1
+
+
+def test_resolve_many_attributes_direct_rules():
+    """Apply direct resolve rules to each attribute resolved at once."""
+
+    class Container(Injector):
+        foo = this.bar
+        bar = 1
+
+    with pytest.raises(DependencyError) as exc_info:
+        resolve(Container, "foo")
+
+    expected = "'this' dependencies could only be used to instantiate classes"
+    assert str(exc_info.value) == expected
+
+
+def test_resolve_protect_against_classes():
+    """Deny to resolve many attributes of regular classes."""
+
+    class Foo:
+        pass
+
+    with pytest.raises(DependencyError) as exc_info:
+        resolve(Foo, "bar")
+
+    expected = "'resolve' function can be used on Injector subclasses only"
+    assert str(exc_info.value) == expected
+
+
+def test_aresolve_many_attributes():
+    """Resolve many attributes in the same scope awaiting coroutine functions.
+
+    Dependencies shared between attributes should be built once.
+
+    """
+    times = []
+
+    class Users:
+        def __init__(self, connection):
+            self.connection = connection
+
+    class Orders:
+        def __init__(self, connection, limit):
+            self.connection = connection
+
+    class Container(Injector):
+        users = Users
+        orders = Orders
+        limit = 10
+
+        @value
+        async def connection():
+            times.append(1)
+            await asyncio.sleep(0)
+            return "connection"
+
+    users, orders = asyncio.run(aresolve(Container, "users", "orders"))
+    assert users.connection == orders.connection == "connection"
+    assert sum(times) == 1
+
+    (users,) = asyncio.run(aresolve(Container(connection="override"), "users"))
+    assert users.connection == "override"
+
+
+def test_aresolve_concurrent_branches():
+    """Await independent branches of the dependency graph concurrently."""
+    result = []
+
+    class Service:
+        def __init__(self, users, orders, payments):
+            self.clients = [users, orders, payments]
+
+    async def handshake(name):
+        result.append(f"connect {name}")
+        await asyncio.sleep(0)
+        result.append(f"ready {name}")
+        return name
+
+    class Container(Injector):
+        service = Service
+
+        @value
+        async def users():
+            return await handshake("users")
+
+        @value
+        async def orders():
+            return await handshake("orders")
+
+        @value
+        async def payments(orders):
+            return await handshake(f"payments after {orders}")
+
+    (service,) = asyncio.run(aresolve(Container, "service"))
+    assert service.clients == ["users", "orders", "payments after orders"]
+    assert result == [
+        "connect users",
+        "connect orders",
+        "ready users",
+        "ready orders",
+        "connect payments after orders",
+        "ready payments after orders",
+    ]
+
+
+def test_aresolve_cancel_branches():
+    """Cancel other branches when one of them fails."""
+    result = []
+
+    class Service:
+        def __init__(self, users, orders):
+            raise RuntimeError
+
+    class Container(Injector):
+        service = Service
+
+        @value
+        async def users():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                result.append("cancelled")
+                raise
+
+        @value
+        async def orders():
+            await asyncio.sleep(0)
+            raise ValueError
+
+    with pytest.raises(ValueError):
+        asyncio.run(aresolve(Container, "service"))
+
+    assert result == ["cancelled"]
+
+
+def test_aresolve_coroutine_function_directly():
+    """Coroutine functions could not be resolved without `aresolve` function."""
+
+    class Service:
+        def __init__(self, users):
+            raise RuntimeError
+
+    class Container(Injector):
+        service = Service
+
+        @value
+        async def users():
+            raise RuntimeError
+
+    with pytest.raises(DependencyError) as exc_info:
+        Container.service
+
+    expected = """
+'users' coroutine function could be resolved by 'aresolve' function only:
+
+Container.service
+  Container.users
+    """.strip()
+
+    assert str(exc_info.value) == expected
+
+
+def test_aresolve_this_expressions():
+    """Await coroutine functions reached by `this` expressions and nested injectors."""
+
+    class Service:
+        def __init__(self, users, orders, limit):
+            self.users = users
+            self.orders = orders
+            self.limit = limit
+
+    class Container(Injector):
+        service = Service
+        users = this.client
+        orders = this.Nested.orders
+        limit = this.settings["limit"]
+        settings = {"limit": 10}
+
+        @value
+        async def client():
+            await asyncio.sleep(0)
+            return "client"
+
+        class Nested(Injector):
+            orders = this.shop
+
+            @value
+            async def shop(client):
+                await asyncio.sleep(0)
+                return f"shop with {client}"
+
+            client = (this << 1).client
+
+    (service,) = asyncio.run(aresolve(Container, "service"))
+    assert service.users == "client"
+    assert service.orders == "shop with client"
+    assert service.limit == 10
+
+
+def test_aresolve_this_expressions_share_tasks():
+    """Coroutine functions reached by many `this` expressions are awaited once."""
+
+    calls = []
+
+    class Service:
+        def __init__(self, users, orders):
+            self.users = users
+            self.orders = orders
+
+    class Container(Injector):
+        service = Service
+        users = this.client
+        orders = this.Nested.orders
+
+        @value
+        async def client():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "client"
+
+        class Nested(Injector):
+            orders = this.client
+            client = (this << 1).client
+
+    (service,) = asyncio.run(aresolve(Container, "service"))
+    assert service.users == "client"
+    assert service.orders == "client"
+    assert calls == [1]
+
+
+def test_aresolve_shield_this_expressions():
+    """Skip steps already created by `shield` arguments resolved synchronously."""
+
+    class Price:
+        pass
+
+    def box(price):
+        return [price]
+
+    class Service:
+        def __init__(self, total, price):
+            self.total = total
+            self.price = price
+
+    class Container(Injector):
+        service = Service
+        total = shield(box, this.price)
+        price = Price
+
+    (service,) = asyncio.run(aresolve(Container, "service"))
+    assert service.total == [service.price]
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected"),
+    [
+        (this.missing, "Can not resolve attribute 'missing'"),
+        (this.Nested, "Do not depend on nested injectors directly."),
+    ],
+)
+def test_aresolve_this_expressions_errors(expression, expected):
+    """Report errors of `this` expressions which did not reach coroutine values."""
+
+    class Service:
+        def __init__(self, users):
+            raise RuntimeError
+
+    class Container(Injector):
+        service = Service
+        users = expression
+
+        class Nested(Injector):
+            foo = 1
+
+    with pytest.raises(DependencyError) as exc_info:
+        asyncio.run(aresolve(Container, "service"))
+
+    assert expected in str(exc_info.value)
+
+
+def test_aresolve_error_trace():
+    """Errors of coroutine functions should report the path to the attribute."""
+
+    class Service:
+        def __init__(self, users):
+            raise RuntimeError
+
+    class Container(Injector):
+        service = Service
+
+        @value
+        async def users():
+            raise DependencyError("Connection refused")
+
+    with pytest.raises(DependencyError) as exc_info:
+        asyncio.run(aresolve(Container, "service"))
+
+    expected = """
+Connection refused:
+
+Container.service
+  Container.users
+    """.strip()
+
+    assert str(exc_info.value) == expected
+
+
+def test_aresolve_many_attributes_direct_rules():
+    """Apply direct resolve rules to each attribute resolved at once."""
+
+    class Container(Injector):
+        foo = this.bar
+        bar = 1
+
+    with pytest.raises(DependencyError) as exc_info:
+        asyncio.run(aresolve(Container, "foo"))
+
+    expected = "'this' dependencies could only be used to instantiate classes"
+    assert str(exc_info.value) == expected
+
+
+def test_aresolve_protect_against_classes():
+    """Deny to resolve many attributes of regular classes."""
+
+    class Foo:
+        pass
+
+    with pytest.raises(DependencyError) as exc_info:
+        asyncio.run(aresolve(Foo, "bar"))
+
+    expected = "'aresolve' function can be used on Injector subclasses only"
+    assert str(exc_info.value) == expected
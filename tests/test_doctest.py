@@ -18,3 +18,6 @@ class Container(Injector):
     """
 
     foo = Foo
+
+
+Override = Container(foo=Foo)
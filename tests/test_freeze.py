@@ -0,0 +1,170 @@
+"""Tests related to freeze function."""
+import pytest
+
+from dependencies import compiled
+from dependencies import freeze
+from dependencies import Injector
+from dependencies import this
+from dependencies.exceptions import DependencyError
+
+
+def test_freeze_resolve(expect):
+    """Frozen `Injector` subclass should resolve the same graph as regular one."""
+
+    class Foo:
+        def __init__(self, bar, baz):
+            self.bar = bar
+            self.baz = baz
+
+    @freeze
+    class Container(Injector):
+        foo = Foo
+        bar = 1
+        baz = this.Nested.baz
+
+        class Nested(Injector):
+            baz = (this << 1).bar
+
+    @expect(Container, freeze(Container(bar=2)))
+    def to_be(it):
+        assert it.foo.bar == it.foo.baz
+
+
+def test_freeze_compiled():
+    """Frozen compiled `Injector` subclass should resolve attributes."""
+
+    class Foo:
+        def __init__(self, bar):
+            self.bar = bar
+
+    @freeze
+    @compiled
+    class Container(Injector):
+        foo = Foo
+        bar = 1
+
+    assert Container.foo.bar == 1
+
+
+def test_freeze_twice():
+    """`Injector` subclass could be frozen many times."""
+
+    class Container(Injector):
+        foo = 1
+
+    assert freeze(freeze(Container)) is Container
+
+
+def test_freeze_shared_nested_injector():
+    """The same nested injector could be used in many attributes."""
+
+    class Settings(Injector):
+        foo = 1
+
+    class Foo:
+        def __init__(self, bar, baz):
+            self.bar = bar
+            self.baz = baz
+
+    @freeze
+    class Container(Injector):
+        foo = Foo
+        bar = this.first.foo
+        baz = this.second.foo
+        first = Settings
+        second = Settings
+
+    assert Container.foo.bar == Container.foo.baz
+
+
+def test_freeze_incomplete_dependencies_error():
+    """Report missing dependencies of any attribute before it would be accessed."""
+
+    class Foo:
+        def __init__(self, bar):
+            raise RuntimeError
+
+    class Container(Injector):
+        foo = Foo
+        baz = 1
+
+    with pytest.raises(DependencyError) as exc_info:
+        freeze(Container)
+
+    expected = """
+Can not resolve attribute 'bar':
+
+Container.foo
+  Container.bar
+    """.strip()
+
+    assert str(exc_info.value) == expected
+
+
+def test_freeze_nested_incomplete_dependencies_error():
+    """Report missing dependencies of nested injectors."""
+
+    class Foo:
+        def __init__(self, bar):
+            raise RuntimeError
+
+    class Container(Injector):
+        baz = 1
+
+        class Nested(Injector):
+            foo = Foo
+
+    with pytest.raises(DependencyError) as exc_info:
+        freeze(Container)
+
+    expected = """
+Can not resolve attribute 'bar':
+
+Nested.foo
+  Nested.bar
+    """.strip()
+
+    assert str(exc_info.value) == expected
+
+
+def test_freeze_circle_dependency_error():
+    """Report circle definitions of all attributes of the subclass."""
+
+    class Foo:
+        def __init__(self, bar):
+            raise RuntimeError
+
+    class Bar:
+        def __init__(self, foo):
+            raise RuntimeError
+
+    class Container(Injector):
+        foo = Foo
+        bar = Bar
+
+    with pytest.raises(DependencyError) as exc_info:
+        freeze(Container)
+
+    expected = """
+Circle error found in definition of the dependency graph:
+
+Container.foo
+  Container.bar
+    Container.foo
+    """.strip()
+
+    assert str(exc_info.value) == expected
+
+
+def test_freeze_protect_against_classes():
+    """Deny to freeze classes which are not `Injector` subclasses."""
+
+    class Foo:
+        pass
+
+    with pytest.raises(DependencyError) as exc_info:
+        freeze(Foo)
+
+    expected = "'freeze' function can be used on Injector subclasses only"
+
+    assert str(exc_info.value) == expected
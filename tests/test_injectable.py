@@ -1,6 +1,11 @@
 """Tests related to injectable objects."""
+import gc
+import weakref
+from types import FunctionType
+
 import pytest
 
+from dependencies import freeze
 from dependencies import Injector
 from dependencies import value
 from dependencies.exceptions import DependencyError
@@ -18,7 +23,7 @@ def test_deny_variable_length_positional_arguments(d):
         baz = Baz
 
     with pytest.raises(DependencyError) as exc_info:
-        Container.baz
+        freeze(Container)
 
     assert str(exc_info.value) in {
         "'Foo.__init__' have variable-length positional arguments",
@@ -58,7 +63,7 @@ def test_deny_variable_length_keyword_arguments(e):
         baz = Baz
 
     with pytest.raises(DependencyError) as exc_info:
-        Container.baz
+        freeze(Container)
 
     assert str(exc_info.value) in {
         "'Foo.__init__' have variable-length keyword arguments",
@@ -139,7 +144,7 @@ def test_deny_classes_as_default_values(q):
         baz = Baz
 
     with pytest.raises(DependencyError) as exc_info:
-        Container.baz
+        freeze(Container)
 
     expected_class = """
 'Bar' class has a default value of 'foo' argument set to 'Foo' class.
@@ -192,7 +197,7 @@ def test_deny_non_classes_in_class_named_arguments(t):
         baz = Baz
 
     with pytest.raises(DependencyError) as exc_info:
-        Container.baz
+        freeze(Container)
 
     message = str(exc_info.value)
 
@@ -217,3 +222,41 @@ def _class_named():
 def t(request):
     """All class-named argument definitions."""
     return request.param
+
+
+def test_collect_inspected_classes():
+    """Inspected classes should be garbage collected together with injectors."""
+
+    class Foo:
+        def __init__(self, bar):
+            self.bar = bar
+
+    class Container(Injector):
+        foo = Foo
+        bar = 1
+
+    assert Container.foo.bar == 1
+
+    reference = weakref.ref(Foo)
+    del Foo, Container
+    gc.collect()
+
+    assert reference() is None
+
+
+def test_inspect_many_classes():
+    """Resolve classes after the number of inspected classes exceeded the limit."""
+
+    def _init(self, bar):
+        self.bar = bar
+
+    classes = {}
+    for index in range(1100):
+        init = FunctionType(_init.__code__, _init.__globals__)
+        classes[f"foo{index}"] = type(f"Foo{index}", (), {"__init__": init})
+
+    Container = type(Injector)("Container", (Injector,), {**classes, "bar": 1})
+    freeze(Container)
+
+    assert Container.foo0.bar == 1
+    assert Container.foo1099.bar == 1
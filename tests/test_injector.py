@@ -1,9 +1,13 @@
 """Tests related to the Injector classes."""
 from inspect import isclass
+from threading import Barrier
+from threading import Thread
 
 import pytest
 
+from dependencies import freeze
 from dependencies import Injector
+from dependencies import shield
 from dependencies import this
 from dependencies.exceptions import DependencyError
 
@@ -222,7 +226,7 @@ def test_no_reuse_default_value_between_dependencies():
 
     class Bar:
         def __init__(self, x, y=1):
-            pass
+            raise RuntimeError
 
     class Container(Injector):
         foo = Foo
@@ -508,6 +512,19 @@ def test_multiple_inheritance():
     assert isinstance((FooContainer & BarContainer & BazContainer).baz.bar.foo, Foo)
 
 
+def test_multiple_inheritance_memoization():
+    """Composition of the same `Injector` subclasses should return the same class."""
+
+    class Foo(Injector):
+        foo = 1
+
+    class Bar(Injector):
+        bar = 2
+
+    assert (Foo & Bar) is (Foo & Bar)
+    assert (Foo & Bar) is not (Bar & Foo)
+
+
 def test_multiple_inheritance_injectors_order():
     """Order of `Injector` subclasses should affect injection result.
 
@@ -627,6 +644,287 @@ Container.foo
     assert str(exc_info.value) == expected
 
 
+def test_circle_dependency_error_same_injector():
+    """Handle circle definitions between attributes of the same `Injector`."""
+
+    class Foo:
+        def __init__(self, bar):
+            raise RuntimeError
+
+    class Bar:
+        def __init__(self, foo):
+            raise RuntimeError
+
+    class Container(Injector):
+        foo = Foo
+        bar = Bar
+
+    with pytest.raises(DependencyError) as exc_info:
+        Container.foo
+
+    expected = """
+Circle error found in definition of the dependency graph:
+
+Container.foo
+  Container.bar
+    Container.foo
+    """.strip()
+
+    assert str(exc_info.value) == expected
+
+
+def test_circle_dependency_error_self():
+    """Handle attribute depending on itself."""
+
+    class Foo:
+        def __init__(self, foo):
+            raise RuntimeError
+
+    class Container(Injector):
+        foo = Foo
+
+    with pytest.raises(DependencyError) as exc_info:
+        Container.foo
+
+    expected = """
+Circle error found in definition of the dependency graph:
+
+Container.foo
+  Container.foo
+    """.strip()
+
+    assert str(exc_info.value) == expected
+
+
+def test_circle_dependency_error_keyword_argument():
+    """Handle circle definitions through keyword arguments with default values."""
+
+    class Foo:
+        def __init__(self, bar=None):
+            raise RuntimeError
+
+    class Bar:
+        def __init__(self, baz, foo=None):
+            raise RuntimeError
+
+    class Container(Injector):
+        foo = Foo
+        bar = Bar
+        baz = 1
+
+    with pytest.raises(DependencyError) as exc_info:
+        Container.foo
+
+    expected = """
+Circle error found in definition of the dependency graph:
+
+Container.foo
+  Container.bar
+    Container.foo
+    """.strip()
+
+    assert str(exc_info.value) == expected
+
+
+def test_circle_dependency_error_shield(e):
+    """Handle circle definitions through arguments of shield object."""
+
+    class Bar:
+        def __init__(self, foo):
+            raise RuntimeError
+
+    class Container(Injector):
+        foo = shield(e.StarArgs, this.baz, this.SubContainer.bar)
+        baz = 1
+
+        class SubContainer(Injector):
+            bar = (this << 1).bar
+
+        bar = Bar
+
+    with pytest.raises(DependencyError) as exc_info:
+        Container.foo
+
+    expected = """
+Circle error found in definition of the dependency graph:
+
+Container.foo
+  SubContainer.bar
+    Container.bar
+      Container.foo
+    """.strip()
+
+    assert str(exc_info.value) == expected
+
+
+def test_circle_dependency_error_package():
+    """Handle circle definitions through `Injector` subclass in another module."""
+    from _ import examples
+
+    class Container(Injector):
+        baz = examples.injected.Container.bar
+
+    with pytest.raises(DependencyError) as exc_info:
+        Container.baz
+
+    expected = """
+Circle error found in definition of the dependency graph:
+
+Container.baz
+  Container.bar
+    Container.baz
+    """.strip()
+
+    assert str(exc_info.value) == expected
+
+
+def test_circle_dependency_error_unrelated_attribute():
+    """Circle definitions are found by `freeze` before any attribute would be resolved.
+
+    Attribute which does not depend on the circle should not be resolved as well.
+
+    """
+
+    class Foo:
+        def __init__(self, foo):
+            raise RuntimeError
+
+    class Bar:
+        def __init__(self):
+            raise RuntimeError
+
+    class Container(Injector):
+        foo = Foo
+        bar = Bar
+
+    with pytest.raises(DependencyError) as exc_info:
+        freeze(Container)
+
+    expected = """
+Circle error found in definition of the dependency graph:
+
+Container.foo
+  Container.foo
+    """.strip()
+
+    assert str(exc_info.value) == expected
+
+
+def test_circle_dependency_error_multiple_inheritance():
+    """Handle circle definitions made by attributes of different bases."""
+
+    class Foo:
+        def __init__(self, bar):
+            raise RuntimeError
+
+    class Bar:
+        def __init__(self, foo):
+            raise RuntimeError
+
+    class FooContainer(Injector):
+        foo = Foo
+
+    class BarContainer(Injector):
+        bar = Bar
+
+    assert "foo" in FooContainer
+    assert "bar" in BarContainer
+
+    with pytest.raises(DependencyError) as exc_info:
+        (BarContainer & FooContainer).foo
+
+    expected = """
+Circle error found in definition of the dependency graph:
+
+BarContainer.foo
+  BarContainer.bar
+    BarContainer.foo
+    """.strip()
+
+    assert str(exc_info.value) == expected
+
+
+def test_deep_inheritance():
+    """Subclasses should see attributes defined at any level of the hierarchy."""
+
+    class Foo:
+        def __init__(self, bar, baz):
+            self.bar = bar
+            self.baz = baz
+
+    class Container(Injector):
+        foo = Foo
+        bar = 0
+        baz = 0
+
+    for level in range(1, 50):
+        Container = type(Injector)("Container", (Container,), {"bar": level})
+
+    class Child(Container):
+        baz = 1
+
+    assert Child.foo.bar == 49
+    assert Child.foo.baz == 1
+    assert "foo" in Child
+    assert dir(Child) == ["bar", "baz", "foo"]
+
+
+def test_analyze_attributes_on_demand():
+    """Definitions of attributes should be analyzed when they are needed.
+
+    Errors in definitions of unrelated attributes would be reported by `freeze`.
+
+    """
+
+    class Foo:
+        def __init__(self, bar):
+            self.bar = bar
+
+    class Container(Injector):
+        foo = Foo
+        bar = 1
+        baz = this
+
+    assert Container.foo.bar == 1
+
+    with pytest.raises(DependencyError) as exc_info:
+        freeze(Container)
+
+    expected = "You can not use 'this' directly in the 'Injector'"
+
+    assert str(exc_info.value) == expected
+
+
+def test_analyze_attributes_from_many_threads():
+    """Attributes accessed from many threads at once should be analyzed once."""
+    results = []
+    barrier = Barrier(8)
+
+    class Foo:
+        def __init__(self, aa, bb, cc, dd):
+            self.args = (aa, bb, cc, dd)
+
+    class Container(Injector):
+        foo = Foo
+        aa = 1
+        bb = 2
+        cc = 3
+        dd = 4
+
+    def access():
+        barrier.wait()
+        results.append(Container.foo.args)
+
+    threads = [Thread(target=access) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [(1, 2, 3, 4)] * 8
+    assert not Container.__dependencies__.pending
+
+
 def test_has_attribute():
     """`Injector` should support `in` statement."""
 
@@ -5,6 +5,7 @@ from enum import unique
 
 import pytest
 
+from dependencies import freeze
 from dependencies import Injector
 from dependencies.exceptions import DependencyError
 
@@ -33,7 +34,7 @@ def test_deny_enums():
         choices = Choices
 
     with pytest.raises(DependencyError) as exc_info:
-        Container.foo
+        freeze(Container)
 
     expected = """
 Attribute 'choices' contains Enum.
@@ -0,0 +1,241 @@
+"""Tests related to lazy object."""
+import pytest
+
+from dependencies import Injector
+from dependencies import lazy
+from dependencies import singleton
+from dependencies import value
+from dependencies.exceptions import DependencyError
+
+
+def test_postpone_injection(expect):
+    """Build lazy dependency on the first attribute access of the proxy."""
+    times = []
+
+    class Renderer:
+        def __init__(self, template):
+            times.append(1)
+            self.template = template
+
+        def render(self):
+            return f"<{self.template}>"
+
+    class Service:
+        def __init__(self, renderer):
+            self.renderer = renderer
+
+    class Container(Injector):
+        service = Service
+        renderer = lazy(Renderer)
+        template = "pdf"
+
+    @expect(Container)
+    def to_be(it):
+        service = it.service
+        assert sum(times) == 0
+        assert service.renderer.render() == "<pdf>"
+        assert service.renderer.template == "pdf"
+        assert sum(times) == 1
+        times.clear()
+
+
+def test_resolve_in_the_same_scope():
+    """Arguments of lazy dependency should be taken from the originating scope."""
+
+    class Connection:
+        pass
+
+    class Renderer:
+        def __init__(self, connection, size=10):
+            self.connection = connection
+            self.size = size
+
+    class Service:
+        def __init__(self, renderer, connection):
+            self.renderer = renderer
+            self.connection = connection
+
+    class Container(Injector):
+        service = Service
+        renderer = lazy(Renderer)
+        connection = Connection
+
+    service = Container.service
+    assert service.renderer.connection is service.connection
+    assert service.renderer.size == 10
+
+
+def test_many_proxies_in_the_same_scope():
+    """Each lazy dependency of the scope should get its own proxy."""
+
+    class Renderer:
+        def __init__(self, template):
+            self.template = template
+
+    class Service:
+        def __init__(self, html, pdf):
+            self.html = html
+            self.pdf = pdf
+
+    class Container(Injector):
+        service = Service
+        html = lazy(Renderer)
+        pdf = lazy(Renderer)
+        template = "report"
+
+    with Container as container:
+        service = container.service
+    assert service.html.template == "report"
+    assert service.pdf.template == "report"
+
+
+def test_resolve_missing_dependency_on_access():
+    """Missing arguments of lazy dependency should be reported on proxy access."""
+
+    class Renderer:
+        def __init__(self, template):
+            raise RuntimeError
+
+    class Service:
+        def __init__(self, renderer):
+            self.renderer = renderer
+
+    class Container(Injector):
+        service = Service
+        renderer = lazy(Renderer)
+
+    service = Container.service
+
+    with pytest.raises(DependencyError) as exc_info:
+        service.renderer.render
+
+    expected = """
+Can not resolve attribute 'template':
+
+Container.template
+    """.strip()
+
+    assert str(exc_info.value) == expected
+
+
+def test_lazy_value():
+    """Evaluate @value function on the first attribute access of the proxy."""
+    times = []
+
+    class Client:
+        def __init__(self, model):
+            self.model = model
+
+    def load(name):
+        times.append(1)
+        return {"name": name}
+
+    class Container(Injector):
+        client = Client
+        model = lazy(value(load))
+        name = "large"
+
+    client = Container.client
+    assert sum(times) == 0
+    assert client.model.get("name") == "large"
+    assert sum(times) == 1
+
+
+def test_lazy_none():
+    """Dependency returning `None` should be evaluated once as well."""
+    times = []
+
+    class Client:
+        def __init__(self, model):
+            self.model = model
+
+    def load():
+        times.append(1)
+
+    class Container(Injector):
+        client = Client
+        model = lazy(value(load))
+
+    client = Container.client
+    assert repr(client.model) == "None"
+    assert repr(client.model) == "None"
+    assert sum(times) == 1
+
+
+def test_proxy_attribute_access():
+    """Proxy should delegate attribute modification and representation."""
+
+    class Renderer:
+        def __repr__(self):
+            return "<renderer>"
+
+    class Service:
+        def __init__(self, renderer):
+            self.renderer = renderer
+
+    class Container(Injector):
+        service = Service
+        renderer = lazy(Renderer)
+
+    renderer = Container.service.renderer
+    renderer.size = 1
+    assert renderer.size == 1
+    del renderer.size
+    assert not hasattr(renderer, "size")
+    assert repr(renderer) == "<renderer>"
+
+
+def test_break_circle_definition():
+    """Lazy dependency could point back to the class which depends on it."""
+
+    class Parent:
+        def __init__(self, child):
+            self.child = child
+
+    class Child:
+        def __init__(self, parent):
+            self.parent = parent
+
+    class Container(Injector):
+        parent = lazy(Parent)
+        child = Child
+
+    child = Container.child
+    assert child.parent.child is child
+
+
+def test_deny_generators():
+    """Deny to use lazy on @value generators."""
+
+    @value
+    def connection():
+        yield 1  # pragma: no cover
+
+    with pytest.raises(DependencyError) as exc_info:
+
+        class Container(Injector):
+            foo = lazy(connection)
+
+        Container.foo
+
+    expected = "'lazy' can not be used on @value generators"
+
+    assert str(exc_info.value) == expected
+
+
+def test_deny_singletons():
+    """Deny to use lazy on singleton objects."""
+
+    class Connection:
+        pass
+
+    with pytest.raises(DependencyError) as exc_info:
+
+        class Container(Injector):
+            foo = lazy(singleton(Connection))
+
+        Container.foo
+
+    expected = "'lazy' can not be used on 'singleton' objects"
+
+    assert str(exc_info.value) == expected
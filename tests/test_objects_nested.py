@@ -80,3 +80,31 @@ Container.foo
     """.strip()
 
     assert expected == str(exc_info.value)
+
+
+def test_deny_classes_depend_on_nested_injectors_this():
+    """Classes should not receive nested injectors through `this` object."""
+
+    class Foo:
+        def __init__(self, bar):
+            raise RuntimeError
+
+    class Container(Injector):
+        foo = Foo
+        bar = this.Bar
+
+        class Bar(Injector):
+            baz = None
+
+    with pytest.raises(DependencyError) as exc_info:
+        Container.foo
+
+    expected = """
+Do not depend on nested injectors directly.
+
+Use this object to access inner attributes of nested injector:
+
+Container.foo
+    """.strip()
+
+    assert expected == str(exc_info.value)
@@ -3,6 +3,7 @@ import inspect
 
 import pytest
 
+from dependencies import freeze
 from dependencies import Injector
 from dependencies import this
 from dependencies.exceptions import DependencyError
@@ -186,6 +187,25 @@ def test_package_provides_lazy_loading():
     assert Container.foo.bar == "baz"
 
 
+def test_package_recursive_injectors():
+    """We can point `Package` to `Injector` subclasses which contain each other."""
+    from _ import examples
+
+    class Root:
+        def __init__(self, foo):
+            self.foo = foo
+
+    class Container(Injector):
+        root = Root
+        foo = examples.recursive.Container.foo
+
+    assert Container.root.foo == 1
+
+    from examples.recursive import Nested
+
+    assert freeze(Nested) is Nested
+
+
 def test_handle_import_error():
     """Import time errors should be propagated.
 
@@ -0,0 +1,328 @@
+"""Tests related to singleton object."""
+from threading import Barrier
+from threading import Thread
+from time import sleep
+
+import pytest
+
+from dependencies import compiled
+from dependencies import freeze
+from dependencies import Injector
+from dependencies import shield
+from dependencies import singleton
+from dependencies import this
+from dependencies import value
+from dependencies.exceptions import DependencyError
+
+
+def test_build_once(expect):
+    """Build singleton dependency once and reuse it on every attribute access."""
+    times = []
+
+    class Connection:
+        def __init__(self, url):
+            times.append(1)
+            self.url = url
+
+    class Service:
+        def __init__(self, connection):
+            self.connection = connection
+
+    class Container(Injector):
+        service = Service
+        connection = singleton(Connection)
+        url = "postgres://"
+
+    @expect(Container, Container)
+    def to_be(it):
+        assert it.service.connection is Container.service.connection
+        assert it.service.connection.url == "postgres://"
+
+    assert sum(times) == 1
+
+
+def test_skip_arguments_of_built_singleton():
+    """Do not build arguments of the singleton dependency once it was built."""
+    times = []
+
+    class Pool:
+        def __init__(self):
+            times.append(1)
+
+    class Connection:
+        def __init__(self, pool):
+            self.pool = pool
+
+    class Container(Injector):
+        connection = singleton(Connection)
+        pool = Pool
+
+    assert Container.connection is Container.connection
+    assert Container.connection.pool is Container.connection.pool
+    assert sum(times) == 1
+
+
+def test_keep_plans_without_singleton():
+    """Building the singleton should forget only plans which built it."""
+
+    class Connection:
+        def __init__(self, url):
+            self.url = url
+
+    class Users:
+        def __init__(self, connection):
+            self.connection = connection
+
+    class Settings:
+        def __init__(self, url):
+            raise RuntimeError
+
+    @freeze
+    class Container(Injector):
+        users = Users
+        settings = Settings
+        connection = singleton(Connection)
+        url = "postgres://"
+
+    plans = Container.__dependencies__.plans
+    assert sorted(plans) == ["connection", "settings", "url", "users"]
+
+    Container.users
+
+    assert sorted(plans) == ["settings", "url"]
+
+    Container.users
+
+    assert sorted(plans) == ["settings", "url", "users"]
+    assert plans["users"].names == {"users"}
+
+
+def test_singleton_value():
+    """Evaluate @value function once."""
+    times = []
+
+    @value
+    def load_settings(name):
+        times.append(1)
+        return {"name": name}
+
+    class Container(Injector):
+        config = shield(dict, this.settings)
+        settings = singleton(load_settings)
+        name = "app"
+
+    assert Container.config == {"name": "app"}
+    assert Container.config == {"name": "app"}
+    assert sum(times) == 1
+
+
+def test_singleton_per_subclass():
+    """Each `Injector` subclass should build its own singleton."""
+
+    class Connection:
+        def __init__(self, url):
+            self.url = url
+
+    class Container(Injector):
+        connection = singleton(Connection)
+        url = "postgres://"
+
+    class Other(Container):
+        url = "mysql://"
+
+    assert Container.connection is Container.connection
+    assert Other.connection is Other.connection
+    assert Container.connection.url == "postgres://"
+    assert Other.connection.url == "mysql://"
+
+
+@pytest.mark.parametrize("decorate", [lambda injector: injector, compiled])
+def test_singleton_shared_with_overrides(decorate):
+    """Overrides should share singletons which do not depend on overridden values."""
+    times = []
+
+    class Connection:
+        def __init__(self, url):
+            times.append(1)
+            self.url = url
+
+    class Cache:
+        def __init__(self, user):
+            self.user = user
+
+    class View:
+        def __init__(self, connection, cache, user):
+            self.connection = connection
+            self.cache = cache
+
+    @decorate
+    class Container(Injector):
+        view = View
+        connection = singleton(Connection)
+        cache = singleton(Cache)
+        url = "postgres://"
+        user = "admin"
+
+    first = Container(user="alice")
+    second = Container(user="bob")
+
+    assert first.view.connection is second.view.connection
+    assert first.view.connection is Container.view.connection
+    assert first.view.cache is first.view.cache
+    assert first.view.cache.user == "alice"
+    assert second.view.cache.user == "bob"
+    assert Container.view.cache.user == "admin"
+    assert sum(times) == 1
+
+
+def test_singleton_built_by_parent():
+    """Arguments of the singleton built by the parent should not be evaluated."""
+    times = []
+
+    class Connection:
+        def __init__(self, url):
+            self.url = url
+
+    class View:
+        def __init__(self, connection, user):
+            self.connection = connection
+
+    class Container(Injector):
+        view = View
+        connection = singleton(Connection)
+
+        @value
+        def url():
+            times.append(1)
+            return "postgres://"
+
+    connection = Container(user="alice").view.connection
+
+    assert Container(user="bob").view.connection is connection
+    assert Container.connection is connection
+    assert sum(times) == 1
+
+
+def test_singleton_depends_on_scope():
+    """Singleton which depends on `this` objects indirectly belongs to the override."""
+
+    class Connection:
+        def __init__(self, url):
+            self.url = url
+
+    class Container(Injector):
+        connection = singleton(Connection)
+        url = this.settings["url"]
+        settings = {"url": "postgres://"}
+
+    assert Container(user="alice").connection is not Container.connection
+
+
+def test_singleton_compiled():
+    """Compiled `Injector` subclass should reuse built singleton dependency."""
+    times = []
+
+    class Connection:
+        def __init__(self):
+            times.append(1)
+
+    class Service:
+        def __init__(self, connection, name):
+            self.connection = connection
+
+    @compiled
+    class Container(Injector):
+        service = Service
+        connection = singleton(Connection)
+        name = "app"
+
+    assert Container.service.connection is Container.service.connection
+    assert Container.connection is Container.service.connection
+    assert sum(times) == 1
+
+
+def test_singleton_open_scope():
+    """Scope opened before singleton was built should receive the same instance."""
+
+    class Connection:
+        pass
+
+    class Service:
+        def __init__(self, connection):
+            self.connection = connection
+
+    class Container(Injector):
+        service = Service
+        connection = singleton(Connection)
+
+    with Container as first:
+        with Container as second:
+            connection = second.connection
+        assert first.service.connection is connection
+
+
+def test_concurrent_access():
+    """Build singleton dependency once when it is accessed from many threads."""
+    times = []
+    results = []
+    barrier = Barrier(8)
+
+    class Connection:
+        def __init__(self):
+            sleep(0.05)
+            times.append(1)
+
+    class Container(Injector):
+        connection = singleton(Connection)
+
+    def access():
+        barrier.wait()
+        results.append(Container.connection)
+
+    threads = [Thread(target=access) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(times) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_deny_generators():
+    """Deny to use singleton on @value generators."""
+
+    @value
+    def connection():
+        yield 1  # pragma: no cover
+
+    with pytest.raises(DependencyError) as exc_info:
+
+        class Container(Injector):
+            foo = singleton(connection)
+
+        Container.foo
+
+    expected = "'singleton' can not be used on @value generators"
+
+    assert str(exc_info.value) == expected
+
+
+@pytest.mark.parametrize("dependency", [this.foo, Injector])
+def test_deny_scope_dependencies(dependency):
+    """Deny to use singleton on dependencies which need the current scope."""
+    with pytest.raises(DependencyError) as exc_info:
+
+        class Container(Injector):
+            bar = singleton(dependency)
+            foo = 1
+
+        Container.bar
+
+    expected = """
+'singleton' can not be used on 'this' objects and nested injectors.
+
+They depend on the scope of the attribute access.
+    """.strip()
+
+    assert str(exc_info.value) == expected
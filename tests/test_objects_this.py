@@ -3,6 +3,7 @@ from inspect import unwrap
 
 import pytest
 
+from dependencies import freeze
 from dependencies import Injector
 from dependencies import this
 from dependencies.exceptions import DependencyError
@@ -381,7 +382,7 @@ def test_deny_this_without_attribute_access(Bar):
         bar = Bar
 
     with pytest.raises(DependencyError) as exc_info:
-        Container.foo
+        freeze(Container)
 
     expected = "You can not use 'this' directly in the 'Injector'"
 
@@ -0,0 +1,418 @@
+"""Tests related to `Injector` call with keyword arguments."""
+import gc
+import inspect
+import weakref
+
+import pytest
+
+from dependencies import compiled
+from dependencies import Injector
+from dependencies import lazy
+from dependencies import resolve
+from dependencies import singleton
+from dependencies import this
+from dependencies import value
+from dependencies.exceptions import DependencyError
+
+
+def test_override_access(expect):
+    """Overridden `Injector` should support attribute access and `with` statement."""
+
+    class Foo:
+        def __init__(self, bar, baz):
+            self.bar = bar
+            self.baz = baz
+
+    class Container(Injector):
+        foo = Foo
+        bar = 1
+        baz = 2
+
+    @expect(Container(bar=3), Container(bar=3)(baz=4))
+    def to_be(it):
+        assert it.foo.bar == 3
+        assert it.foo.baz in {2, 4}
+
+
+def test_override_does_not_change_parent():
+    """Overrides with the same names should not share resolved values."""
+
+    class Foo:
+        def __init__(self, bar):
+            self.bar = bar
+
+    class Container(Injector):
+        foo = Foo
+        bar = 1
+
+    assert Container(bar=2).foo.bar == 2
+    assert Container(bar=3).foo.bar == 3
+    assert Container.foo.bar == 1
+
+
+def test_override_compiled():
+    """Overrides of compiled `Injector` should be resolved with their own values."""
+
+    class Foo:
+        def __init__(self, bar, baz):
+            self.bar = bar
+            self.baz = baz
+
+    class Baz:
+        pass
+
+    @compiled
+    class Container(Injector):
+        foo = Foo
+        bar = 1
+        baz = 2
+
+    assert Container(bar=2).foo.bar == 2
+    assert Container(bar=3).foo.bar == 3
+    assert isinstance(Container(baz=Baz, bar=4).foo.baz, Baz)
+
+
+def test_override_singleton():
+    """Overrides should build their own singletons."""
+
+    class Connection:
+        def __init__(self, url):
+            self.url = url
+
+    class Service:
+        def __init__(self, connection):
+            self.connection = connection
+
+    @compiled
+    class Container(Injector):
+        service = Service
+        connection = singleton(Connection)
+        url = "postgres://"
+
+    first = Container(url="mysql://")
+    second = Container(url="sqlite://")
+
+    assert first.service.connection is first.service.connection
+    assert first.service.connection.url == "mysql://"
+    assert second.service.connection.url == "sqlite://"
+    assert Container.service.connection.url == "postgres://"
+
+
+def test_override_memoization():
+    """The same overrides of the same `Injector` should return the same object."""
+
+    class Container(Injector):
+        foo = 1
+
+    settings = {}
+    override = Container(bar=settings)
+
+    assert Container(bar=settings) is override
+    assert Container(bar={}) is not override
+    assert Container(bar="x" + str(1)) is Container(bar="x" + str(1))
+    assert Container(bar=1) is not Container(bar=True)
+    assert Container(bar=1) is not Container(bar=1.0)
+    assert override(baz=2) is override(baz=2)
+    assert Container(bar=settings, baz=2) is override(baz=2)
+    assert (override & Container) is (override & Container)
+
+
+def test_override_release():
+    """Overrides should not be kept alive by the memoization."""
+
+    class Container(Injector):
+        foo = 1
+
+    reference = weakref.ref(Container(bar=[]))
+    gc.collect()
+
+    assert reference() is None
+
+
+def test_override_unwrap():
+    """Overrides should be unwrapped and named the way `Injector` subclasses are."""
+
+    class Container(Injector):
+        foo = 1
+
+    override = Container(foo=2)
+
+    assert inspect.unwrap(override) is inspect.unwrap(Container)
+    assert override.__qualname__ == Container.__qualname__
+    assert override.__module__ == Container.__module__ == __name__
+
+
+def test_override_repr():
+    """Overrides should show the overridden `Injector` and names of overrides."""
+
+    class Container(Injector):
+        foo = 1
+
+    name = f"{__name__}.test_override_repr.<locals>.Container"
+
+    assert repr(Container(foo=2, bar=3)) == f"<override of {name!r} with foo, bar>"
+
+
+def test_override_reference_counting():
+    """Overrides and their scopes should be freed without garbage collector."""
+
+    class Request:
+        pass
+
+    class Renderer:
+        def __init__(self, request):
+            self.request = request
+
+    class View:
+        def __init__(self, renderer, request):
+            self.renderer = renderer
+
+    class Container(Injector):
+        view = View
+        renderer = lazy(Renderer)
+
+        @value
+        def transaction(request):
+            yield
+
+    request = Request()
+    reference = weakref.ref(request)
+    gc.disable()
+    try:
+        override = Container(request=request)
+        override.view.renderer.request
+        with override as scope:
+            scope.view.renderer.request
+        del override, scope, request
+        assert reference() is None
+    finally:
+        gc.enable()
+
+
+def test_override_reference_counting_untouched_lazy():
+    """Lazy proxies which were never touched should not keep their scope alive."""
+
+    class Request:
+        pass
+
+    class Renderer:
+        def __init__(self, request):
+            raise RuntimeError
+
+    class View:
+        def __init__(self, renderer, request):
+            self.renderer = renderer
+
+    class Container(Injector):
+        view = View
+        renderer = lazy(Renderer)
+
+    request = Request()
+    reference = weakref.ref(request)
+    gc.disable()
+    try:
+        override = Container(request=request)
+        override.view
+        with override as scope:
+            scope.view
+        del override, scope, request
+        assert reference() is None
+    finally:
+        gc.enable()
+
+
+def test_override_setup_and_teardown():
+    """Overrides should execute setup and teardown of inherited @value objects."""
+    result = []
+
+    class Container(Injector):
+        name = "a"
+
+        @value
+        def lock(name):
+            result.append(f"setup {name}")
+            yield
+            result.append(f"teardown {name}")
+
+    class Child(Container):
+        pass_ = 1
+
+    with Child(name="b"):
+        pass
+
+    with Container(lock=1):
+        pass
+
+    assert result == ["setup b", "teardown b"]
+
+
+def test_redefine_setup_and_teardown():
+    """Redefined @value generator should replace inherited one."""
+    result = []
+
+    class Container(Injector):
+        @value
+        def lock():
+            result.append("parent")  # pragma: no cover
+            yield  # pragma: no cover
+
+    class Child(Container):
+        @value
+        def lock():
+            result.append("setup")
+            yield
+            result.append("teardown")
+
+    with Child:
+        pass
+
+    assert result == ["setup", "teardown"]
+
+
+def test_override_subclass():
+    """Overridden `Injector` could be used as a base class."""
+
+    class Foo:
+        def __init__(self, bar, baz):
+            self.bar = bar
+            self.baz = baz
+
+    class Container(Injector):
+        foo = Foo
+        bar = 1
+
+    class Child(Container(bar=2)):
+        baz = 3
+
+    assert issubclass(Child, Container)
+    assert Child.foo.bar == 2
+    assert Child.foo.baz == 3
+
+
+def test_override_composition():
+    """Overridden `Injector` could be composed with other `Injector` subclasses."""
+
+    class Foo:
+        def __init__(self, bar, baz):
+            self.bar = bar
+            self.baz = baz
+
+    class Container(Injector):
+        foo = Foo
+        bar = 1
+
+    class Mixin(Injector):
+        baz = 2
+
+    assert (Container(bar=3) & Mixin).foo.bar == 3
+    assert (Mixin & Container(bar=4)).foo.bar == 4
+
+
+def test_override_nested():
+    """Overridden `Injector` could be used as nested injector."""
+
+    class Foo:
+        def __init__(self, bar):
+            self.bar = bar
+
+    class Settings(Injector):
+        bar = 1
+
+    class Container(Injector):
+        foo = Foo
+        bar = this.Nested.bar
+        Nested = Settings(bar=2)
+
+    assert Container.foo.bar == 2
+
+
+def test_override_introspection():
+    """Overridden `Injector` should support `in`, `dir`, and `resolve`."""
+
+    class Foo:
+        def __init__(self, bar):
+            self.bar = bar
+
+    class Container(Injector):
+        foo = Foo
+        bar = 1
+
+    override = Container(baz=2)
+
+    assert "baz" in override
+    assert "foo" in override
+    assert "quiz" not in override
+    assert dir(override) == ["bar", "baz", "foo"]
+    assert resolve(override, "foo")[0].bar == 1
+
+
+def test_override_deny_modification():
+    """Deny attribute assignment and deletion on overridden `Injector`."""
+
+    class Container(Injector):
+        foo = 1
+
+    override = Container(bar=2)
+
+    with pytest.raises(DependencyError) as exc_info:
+        override.foo = 2
+
+    assert str(exc_info.value) == "'Injector' modification is not allowed"
+
+    with pytest.raises(DependencyError) as exc_info:
+        del override.foo
+
+    assert str(exc_info.value) == "'Injector' modification is not allowed"
+
+
+def test_override_deny_empty_scope_extension():
+    """Overridden `Injector` can't be extended with empty subset."""
+
+    class Container(Injector):
+        foo = 1
+
+    with pytest.raises(DependencyError) as exc_info:
+        Container(bar=2)()
+
+    assert str(exc_info.value) == "Extension scope can not be empty"
+
+
+def test_override_deny_magic_methods():
+    """Overrides should not accept magic methods."""
+
+    class Container(Injector):
+        foo = 1
+
+    with pytest.raises(DependencyError) as exc_info:
+        Container(__eq__=lambda self, other: True)
+
+    assert str(exc_info.value) == "Magic methods are not allowed"
+
+
+def test_override_circle_dependency_error():
+    """Overrides should not introduce circle definitions."""
+
+    class Foo:
+        def __init__(self, bar):
+            raise RuntimeError
+
+    class Bar:
+        def __init__(self, foo):
+            raise RuntimeError
+
+    class Container(Injector):
+        foo = Foo
+        bar = 1
+
+    with pytest.raises(DependencyError) as exc_info:
+        Container(bar=Bar)
+
+    expected = """
+Circle error found in definition of the dependency graph:
+
+Container.bar
+  Container.foo
+    Container.bar
+    """.strip()
+
+    assert str(exc_info.value) == expected
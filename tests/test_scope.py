@@ -54,3 +54,61 @@ def test_sticky_scope():
         db = container.db
 
     assert app.db is db
+
+
+def test_sticky_scope_skip_built_dependencies():
+    """Check sticky scope would not build dependencies it does not need anymore.
+
+    If an object was already instantiated in the sticky scope, its own dependencies
+    should not be instantiated again when another object depends on it.
+
+    """
+    result = []
+
+    class App:
+        def __init__(self, service):
+            self.service = service
+
+    class Service:
+        def __init__(self, db):
+            self.db = db
+
+    class DB:
+        def __init__(self):
+            result.append("db")
+
+    class Container(Injector):
+        app = App
+        service = Service
+        db = DB
+
+    with Container as container:
+        service = container.service
+        app = container.app
+
+    assert app.service is service
+    assert result == ["db"]
+
+
+def test_reuse_scope_classes():
+    """Scopes of the same name should not create new classes on each access.
+
+    Scope state is stored on the instance, so injectors with the same name do not
+    share resolved dependencies.
+
+    """
+
+    class Foo:
+        def __init__(self, bar):
+            self.bar = bar
+
+    class Container(Injector):
+        foo = Foo
+        bar = 1
+
+    Other = type(Injector)("Container", (Injector,), {"foo": Foo, "bar": 2})
+
+    with Container as first, Other as second:
+        assert type(first) is type(second)
+        assert first.foo.bar == 1
+        assert second.foo.bar == 2
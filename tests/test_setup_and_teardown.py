@@ -1,6 +1,16 @@
 """Tests related to setup and teardown of @value decorator."""
+import asyncio
+from threading import Barrier
+from threading import current_thread
+from threading import Thread
+
+import pytest
+
+from dependencies import aresolve
 from dependencies import Injector
+from dependencies import this
 from dependencies import value
+from dependencies.exceptions import DependencyError
 
 
 def test_setup_and_teardown_value():
@@ -99,3 +109,315 @@ def test_setup_and_teardown_execution_order():
         "teardown b",
         "teardown a",
     ]
+
+
+def test_setup_and_teardown_regular_dependencies():
+    """Teardown only @value generators.
+
+    Classes used as arguments of @value generators do not have teardown steps.
+
+    """
+    result = []
+
+    class Resource:
+        def __init__(self, path):
+            self.path = path
+
+    class Container(Injector):
+        resource = Resource
+        path = "/"
+
+        @value
+        def lock(resource):
+            result.append(f"setup {resource.path}")
+            yield resource
+            result.append(f"teardown {resource.path}")
+
+    with Container:
+        assert result == ["setup /"]
+
+    assert result == ["setup /", "teardown /"]
+
+
+def test_async_setup_and_teardown_value():
+    """@value could decorate an async generator function.
+
+    Async generators are set up and torn down together with regular generators in
+    the opposite order.
+
+    """
+    result = []
+
+    class App:
+        def __init__(self, connection, transaction):
+            self.connection = connection
+            self.transaction = transaction
+
+    class Container(Injector):
+        app = App
+
+        @value
+        async def url():
+            return "postgres://"
+
+        @value
+        def transaction(connection):
+            result.append("begin")
+            yield "transaction"
+            result.append("commit")
+
+        @value
+        async def connection(url):
+            await asyncio.sleep(0)
+            result.append(f"connect {url}")
+            yield url
+            await asyncio.sleep(0)
+            result.append(f"disconnect {url}")
+
+    async def main(injector, url):
+        async with injector as container:
+            assert result == [f"connect {url}", "begin"]
+            assert container.app.connection == url
+            assert container.app.transaction == "transaction"
+        assert result == [f"connect {url}", "begin", "commit", f"disconnect {url}"]
+
+    asyncio.run(main(Container, "postgres://"))
+    result.clear()
+    asyncio.run(main(Container(url="sqlite://"), "sqlite://"))
+
+
+def test_async_setup_and_teardown_nested_injector():
+    """Async generators could depend on nested injectors.
+
+    Dependencies resolved by the nested injector in the outer scope are shared with
+    the async generator.
+
+    """
+
+    class Connection:
+        pass
+
+    class Transaction:
+        def __init__(self, connection):
+            self.connection = connection
+
+    class App:
+        def __init__(self, session):
+            self.session = session
+
+    class Container(Injector):
+        app = App
+        connection = Connection
+        transaction = this.Nested.transaction
+
+        @value
+        async def session(transaction, connection):
+            yield transaction, connection
+
+        class Nested(Injector):
+            transaction = Transaction
+            connection = (this << 1).connection
+
+    async def main():
+        async with Container as container:
+            transaction, connection = container.app.session
+            assert transaction.connection is connection
+
+    asyncio.run(main())
+
+
+def test_async_setup_and_teardown_with_statement_error():
+    """Async generators could not be used outside of `async with` statement."""
+
+    class App:
+        def __init__(self, connection):
+            raise RuntimeError
+
+    class Container(Injector):
+        app = App
+
+        @value
+        async def connection():
+            raise RuntimeError
+            yield  # pragma: no cover
+
+    expected = """
+'connection' async generator could be used in 'async with' statement only:
+
+Container.app
+  Container.connection
+    """.strip()
+
+    with pytest.raises(DependencyError) as exc_info:
+        Container.app
+
+    assert str(exc_info.value) == expected
+
+    with pytest.raises(DependencyError) as exc_info:
+        with Container:
+            raise RuntimeError  # pragma: no cover
+
+    expected = """
+'connection' async generator could be used in 'async with' statement only:
+
+Container.connection
+    """.strip()
+
+    assert str(exc_info.value) == expected
+
+    with pytest.raises(DependencyError) as exc_info:
+        asyncio.run(aresolve(Container, "app"))
+
+    expected = """
+'connection' async generator could be used in 'async with' statement only:
+
+Container.app
+  Container.connection
+    """.strip()
+
+    assert str(exc_info.value) == expected
+
+
+def test_async_setup_and_teardown_aresolve():
+    """`aresolve` could be used on the scope of open `async with` statement.
+
+    Services could depend on async generators and coroutine functions at once.
+
+    """
+    result = []
+
+    class App:
+        def __init__(self, connection, settings):
+            self.connection = connection
+            self.settings = settings
+
+    class Container(Injector):
+        app = App
+
+        @value
+        async def connection():
+            result.append("open")
+            yield "connection"
+            result.append("close")
+
+        @value
+        async def settings():
+            return "settings"
+
+    async def main():
+        async with Container as container:
+            (app,) = await aresolve(container, "app")
+            assert app.connection == "connection"
+            assert app.settings == "settings"
+            assert result == ["open"]
+
+    asyncio.run(main())
+
+    assert result == ["open", "close"]
+
+
+def test_setup_and_teardown_threads():
+    """`with` statements of different threads do not share teardown steps."""
+    result = []
+    entered = Barrier(2)
+    exited = Barrier(2)
+
+    class Container(Injector):
+        @value
+        def lock():
+            name = current_thread().name
+            yield name
+            result.append(f"teardown {name}")
+
+    def first():
+        with Container:
+            entered.wait()
+        result.append("first done")
+        exited.wait()
+
+    def second():
+        with Container:
+            entered.wait()
+            exited.wait()
+        result.append("second done")
+
+    threads = [Thread(target=first, name="first"), Thread(target=second, name="second")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert result == ["teardown first", "first done", "teardown second", "second done"]
+
+
+def test_setup_and_teardown_tasks():
+    """`async with` statements of different tasks do not share teardown steps."""
+    result = []
+    names = iter(["first", "second"])
+
+    class Container(Injector):
+        @value
+        async def lock():
+            name = next(names)
+            yield name
+            result.append(f"teardown {name}")
+
+    async def first(entered, exited):
+        async with Container:
+            await entered.wait()
+        result.append("first done")
+        exited.set()
+
+    async def second(entered, exited):
+        async with Container:
+            entered.set()
+            await exited.wait()
+        result.append("second done")
+
+    async def main():
+        entered, exited = asyncio.Event(), asyncio.Event()
+        await asyncio.gather(first(entered, exited), second(entered, exited))
+
+    asyncio.run(main())
+
+    assert result == ["teardown first", "first done", "teardown second", "second done"]
+
+
+def test_setup_and_teardown_different_tasks():
+    """`async with` statement could be left in another task than it was entered."""
+    result = []
+
+    class Container(Injector):
+        @value
+        async def connection():
+            result.append("open")
+            yield "connection"
+            result.append("close")
+
+    async def enter():
+        await Container.__aenter__()
+
+    async def exit_():
+        await Container.__aexit__(None, None, None)
+
+    async def main():
+        await asyncio.create_task(enter())
+        await asyncio.create_task(exit_())
+
+    asyncio.run(main())
+
+    assert result == ["open", "close"]
+
+
+def test_setup_and_teardown_exit_without_enter():
+    """Leaving `with` statement which was never entered should be reported."""
+
+    class Container(Injector):
+        foo = 1
+
+    with pytest.raises(DependencyError) as exc_info:
+        Container.__exit__(None, None, None)
+
+    expected = "'with' statement was left without being entered"
+
+    assert str(exc_info.value) == expected
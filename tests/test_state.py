@@ -274,3 +274,24 @@ def d_times():
 def e_times():
     """Count number of times object was built."""
     return []
+
+
+def test_wide_constructor_arguments():
+    """Match arguments of the wide constructor in the order of its signature.
+
+    Missing arguments with default values should be skipped, while arguments already
+    stored in the scope should be passed without evaluation.
+
+    """
+
+    class Root:
+        def __init__(self, a, b=2, c=3, d=4, e=5):
+            self.args = (a, b, c, d, e)
+
+    class Container(Injector):
+        root = Root
+        a = this.c
+        c = 30
+        e = this.a
+
+    assert Container.root.args == (30, 2, 30, 4, 30)
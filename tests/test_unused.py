@@ -0,0 +1,89 @@
+"""Tests related to unused function."""
+import pytest
+
+from dependencies import Injector
+from dependencies import this
+from dependencies import unused
+from dependencies.exceptions import DependencyError
+
+
+def test_unused_from_attributes():
+    """Report attributes which are not needed by given attributes."""
+
+    class Foo:
+        def __init__(self, bar, baz):
+            raise RuntimeError
+
+    class Container(Injector):
+        foo = Foo
+        bar = this.Nested.bar
+        baz = 1
+        quiz = 2
+
+        class Nested(Injector):
+            bar = (this << 1).baz
+            egg = 3
+
+    assert unused(Container, "foo") == ["quiz"]
+    assert unused(Container, "bar") == ["foo", "quiz"]
+    assert unused(Container, "foo", "quiz") == []
+
+
+def test_unused_from_accessed_attributes():
+    """Report attributes which are not needed by accessed attributes."""
+
+    class Foo:
+        def __init__(self, bar):
+            self.bar = bar
+
+    class Quiz:
+        def __init__(self, baz):
+            self.baz = baz
+
+    class Container(Injector):
+        foo = Foo
+        bar = 1
+        baz = 2
+        quiz = Quiz
+
+    assert unused(Container) == ["bar", "baz", "foo", "quiz"]
+
+    Container.foo
+
+    assert unused(Container) == ["baz", "quiz"]
+
+    with Container as scope:
+        scope.quiz
+
+    assert unused(Container) == []
+
+
+def test_unused_overrides():
+    """Overrides should share accessed attributes with the `Injector` subclass."""
+
+    class Foo:
+        def __init__(self, bar):
+            self.bar = bar
+
+    class Container(Injector):
+        foo = Foo
+        bar = 1
+
+    Container(baz=2).foo
+
+    assert unused(Container) == []
+    assert unused(Container(baz=2)) == ["baz"]
+
+
+def test_unused_protect_against_classes():
+    """Deny to report classes which are not `Injector` subclasses."""
+
+    class Foo:
+        pass
+
+    with pytest.raises(DependencyError) as exc_info:
+        unused(Foo)
+
+    expected = "'unused' function can be used on Injector subclasses only"
+
+    assert str(exc_info.value) == expected
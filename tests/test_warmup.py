@@ -0,0 +1,53 @@
+"""Tests related to warmup function."""
+import runpy
+
+import pytest
+
+from dependencies import warmup
+
+
+def test_warmup():
+    """Analyze every `Injector` subclass defined in the package and its modules."""
+    timings = warmup("containers")
+
+    assert list(timings) == [
+        "containers.Settings",
+        "containers.services.users.Users",
+        "containers.services.users.Mixin",
+    ]
+    assert all(seconds >= 0 for seconds in timings.values())
+
+    from containers.services.users import Users
+
+    assert Users.repository.connection.url == "postgres://"
+
+
+def test_warmup_module():
+    """Analyze `Injector` subclasses of a single module."""
+    timings = warmup("containers.services.users")
+
+    assert list(timings) == [
+        "containers.services.users.Users",
+        "containers.services.users.Mixin",
+    ]
+
+
+def test_warmup_import_error():
+    """Report modules which could not be imported."""
+    with pytest.raises(ImportError):
+        warmup("examples")
+
+
+def test_warmup_command(monkeypatch, capsys):
+    """Report time spent on each `Injector` subclass from the command line."""
+    monkeypatch.setattr("sys.argv", ["dependencies", "warmup", "containers"])
+
+    runpy.run_module("dependencies", run_name="__main__")
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[-1] for line in lines] == [
+        "containers.Settings",
+        "containers.services.users.Users",
+        "containers.services.users.Mixin",
+        "total",
+    ]